@@ -15,10 +15,20 @@ existentes;
 d) Formate as saídas de forma clara e organizada (se quiser pode usar a biblioteca tabulate).'''
 
 # Importação de bibliotecas necessárias
+import argparse  # Para ler as opções do modo em lote
+import heapq  # Para manter os blocos livres do planejamento VLSM em ordem de endereço
 import json  # Para salvar os resultados em arquivos JSON
 import os  # Para verificar a existência de arquivos no sistema
+import sys  # Para ler da entrada padrão e escrever na saída padrão
+from concurrent.futures import ProcessPoolExecutor  # Para planejar vários sites em paralelo
+from functools import lru_cache  # Para guardar as sub-redes já calculadas
 from tabulate import tabulate  # Para exibir dados formatados em tabela no console
 
+try:
+    import numpy as np  # Opcional: usado apenas no cálculo vetorizado de sub-redes
+except ImportError:
+    np = None
+
 # ===================== Funções Auxiliares =====================
 
 def verificar_endereco_ip(endereco):
@@ -44,73 +54,286 @@ def validar_prefixo_rede(prefixo):
         raise ValueError("Prefixo de rede inválido. Deve estar entre 0 e 32.")
     return prefixo
 
-def converter_ip_binario(endereco):
+def converter_ip_inteiro(endereco):
     """
-    Converte o endereço IP para uma representação binária.
-    - Cada segmento do endereço é convertido para 8 bits binários.
+    Converte o endereço IP para um inteiro de 32 bits.
+    - Cada segmento ocupa 8 bits, do mais significativo para o menos significativo.
     """
-    segmentos = map(int, endereco.split("."))
-    return ''.join(f"{segmento:08b}" for segmento in segmentos)
+    segmento1, segmento2, segmento3, segmento4 = map(int, endereco.split("."))
+    return (segmento1 << 24) | (segmento2 << 16) | (segmento3 << 8) | segmento4
 
-def converter_binario_ip(binario):
+def converter_inteiro_ip(valor):
     """
-    Converte uma string binária em um endereço IP no formato decimal.
-    - Divide a string em blocos de 8 bits e converte cada bloco em decimal.
+    Converte um inteiro de 32 bits em um endereço IP no formato decimal.
+    - Extrai cada bloco de 8 bits com deslocamentos e máscaras.
     """
-    segmentos = [str(int(binario[i:i+8], 2)) for i in range(0, 32, 8)]
-    return ".".join(segmentos)
+    return f"{valor >> 24}.{(valor >> 16) & 255}.{(valor >> 8) & 255}.{valor & 255}"
+
+# Máscaras de rede de /0 a /32 como inteiros de 32 bits
+MASCARAS_INTEIRAS = [(0xFFFFFFFF << (32 - prefixo)) & 0xFFFFFFFF for prefixo in range(33)]
+
+# Máscara decimal, máscara binária e total de hosts de cada prefixo, calculados uma única vez
+TABELA_MASCARAS = [
+    (converter_inteiro_ip(mascara), f"{mascara:032b}", (1 << (32 - prefixo)) - 2)
+    for prefixo, mascara in enumerate(MASCARAS_INTEIRAS)
+]
+
+# Quantidade padrão de sub-redes (rede, prefixo) guardadas no cache
+TAMANHO_CACHE_PADRAO = 65536
 
 # ================= Funções de Negócio/Sub-redes ================
 
-def gerar_informacoes_subrede(endereco, prefixo):
+def calcular_subrede_inteira(endereco_inteiro, prefixo):
     """
-    Gera informações detalhadas sobre uma sub-rede:
-    - Calcula o endereço de rede, broadcast, primeiro e último host.
-    - Calcula o total de hosts disponíveis.
-    - Converte a máscara para os formatos binário e decimal.
+    Calcula os endereços de uma sub-rede usando aritmética de inteiros de 32 bits:
+    - A rede mantém apenas os bits do prefixo (E lógico com a máscara).
+    - O broadcast liga todos os bits fora do prefixo (OU lógico com a máscara invertida).
+    - O primeiro host liga o último bit da rede; o último host desliga o último bit do broadcast.
+    - Retorna a tupla (rede, primeiro host, último host, broadcast, máscara, total de hosts).
     """
-    # Converte o endereço IP para binário
-    endereco_bin = converter_ip_binario(endereco)
-    
-    # Calcula a parte da rede (todos os bits adicionais são 0)
-    rede_binaria = endereco_bin[:prefixo] + "0" * (32 - prefixo)
-    
-    # Calcula o endereço de broadcast (todos os bits adicionais são 1)
-    broadcast_binaria = endereco_bin[:prefixo] + "1" * (32 - prefixo)
-    
-    # Calcula os endereços do primeiro e do último host
-    primeiro_host = converter_binario_ip(rede_binaria[:-1] + "1")  # Muda o último bit para 1
-    ultimo_host = converter_binario_ip(broadcast_binaria[:-1] + "0")  # Muda o último bit para 0
-    
-    # Calcula o número total de hosts válidos na sub-rede
-    total_hosts = (2 ** (32 - prefixo)) - 2
-    
-    # Converte a máscara para os formatos binário e decimal
-    mascara_binaria = "1" * prefixo + "0" * (32 - prefixo)
-    mascara_decimal = converter_binario_ip(mascara_binaria)
-    
-    # Retorna as informações em um dicionário
+    mascara = MASCARAS_INTEIRAS[prefixo]
+    rede = endereco_inteiro & mascara
+    broadcast = rede | (~mascara & 0xFFFFFFFF)
+    return rede, rede | 1, broadcast & 0xFFFFFFFE, broadcast, mascara, TABELA_MASCARAS[prefixo][2]
+
+def formatar_subrede(prefixo, rede, primeiro_host, ultimo_host, broadcast, mascara, total_hosts):
+    """
+    Monta o dicionário de uma sub-rede a partir dos valores inteiros calculados.
+    - É o formato consumido por `salvar_em_json` e `mostrar_em_tabela`.
+    """
+    mascara_decimal, mascara_binaria, _ = TABELA_MASCARAS[prefixo]
     return {
         "CIDR": f"/{prefixo}",
-        "Endereço da Rede": converter_binario_ip(rede_binaria),
-        "Primeiro Host": primeiro_host,
-        "Último Host": ultimo_host,
-        "Broadcast": converter_binario_ip(broadcast_binaria),
+        "Endereço da Rede": converter_inteiro_ip(rede),
+        "Primeiro Host": converter_inteiro_ip(primeiro_host),
+        "Último Host": converter_inteiro_ip(ultimo_host),
+        "Broadcast": converter_inteiro_ip(broadcast),
         "Máscara de Rede": mascara_decimal,
         "Máscara Binária": mascara_binaria,
         "Total de Hosts": total_hosts
     }
 
+def gerar_informacoes_subrede(endereco, prefixo):
+    """
+    Gera informações detalhadas sobre uma sub-rede:
+    - Calcula o endereço de rede, broadcast, primeiro e último host.
+    - Calcula o total de hosts disponíveis.
+    - Converte a máscara para os formatos binário e decimal.
+    """
+    endereco_inteiro = converter_ip_inteiro(endereco)
+    return dict(_informacoes_rede_em_cache(endereco_inteiro & MASCARAS_INTEIRAS[prefixo], prefixo))
+
 def calcular_varias_subredes(endereco, prefixo_inicio, prefixo_fim):
     """
     Calcula informações para múltiplas sub-redes com base em um intervalo de prefixos.
     - Para cada prefixo no intervalo, calcula informações detalhadas da sub-rede.
     """
+    endereco_inteiro = converter_ip_inteiro(endereco)
     lista_subredes = []
     for prefixo in range(prefixo_inicio, prefixo_fim + 1):
-        lista_subredes.append(gerar_informacoes_subrede(endereco, prefixo))
+        rede = endereco_inteiro & MASCARAS_INTEIRAS[prefixo]
+        lista_subredes.append(dict(_informacoes_rede_em_cache(rede, prefixo)))
     return lista_subredes
 
+# ===================== Cache de Sub-redes ======================
+
+def _informacoes_rede(rede, prefixo):
+    """
+    Calcula o dicionário de uma sub-rede a partir do endereço de rede (inteiro).
+    - Endereços da mesma rede produzem o mesmo resultado, por isso o cache usa a rede
+      (e não o endereço digitado) como chave.
+    """
+    return formatar_subrede(prefixo, *calcular_subrede_inteira(rede, prefixo))
+
+_informacoes_rede_em_cache = lru_cache(maxsize=TAMANHO_CACHE_PADRAO)(_informacoes_rede)
+
+def configurar_cache_subredes(tamanho_maximo):
+    """
+    Define o tamanho máximo do cache de sub-redes (descarta o conteúdo atual).
+    - O cache descarta as sub-redes usadas há mais tempo (LRU) ao atingir o limite.
+    - Com tamanho 0, o cache é desativado; com None, não tem limite.
+    """
+    global _informacoes_rede_em_cache
+    if tamanho_maximo is not None and tamanho_maximo < 0:
+        raise ValueError("O tamanho do cache não pode ser negativo.")
+    _informacoes_rede_em_cache = lru_cache(maxsize=tamanho_maximo)(_informacoes_rede)
+
+def estatisticas_cache_subredes():
+    """
+    Retorna as estatísticas do cache de sub-redes: acertos, falhas, taxa de acerto,
+    tamanho atual e tamanho máximo.
+    """
+    informacoes = _informacoes_rede_em_cache.cache_info()
+    consultas = informacoes.hits + informacoes.misses
+    return {
+        "acertos": informacoes.hits,
+        "falhas": informacoes.misses,
+        "taxa_acerto": informacoes.hits / consultas if consultas else 0.0,
+        "tamanho_atual": informacoes.currsize,
+        "tamanho_maximo": informacoes.maxsize
+    }
+
+# ===================== Planejamento VLSM ======================
+
+def separar_bloco_cidr(bloco_cidr):
+    """
+    Valida um bloco no formato "10.0.0.0/16" e retorna (rede inteira, prefixo).
+    - O endereço é normalizado para o endereço da rede.
+    """
+    endereco, _, prefixo = bloco_cidr.partition("/")
+    verificar_endereco_ip(endereco)
+    if not prefixo.isdigit():
+        raise ValueError("Bloco CIDR inválido. Exemplo válido: '10.0.0.0/16'.")
+    prefixo = validar_prefixo_rede(int(prefixo))
+    return converter_ip_inteiro(endereco) & MASCARAS_INTEIRAS[prefixo], prefixo
+
+def prefixo_para_hosts(quantidade_hosts):
+    """
+    Calcula o maior prefixo (menor sub-rede) com hosts válidos suficientes.
+    - Uma sub-rede /N tem 2^(32 - N) - 2 hosts válidos (rede e broadcast não contam).
+    """
+    if quantidade_hosts < 1:
+        raise ValueError("A quantidade de hosts deve ser maior que zero.")
+    bits_hosts = (quantidade_hosts + 1).bit_length()
+    if bits_hosts > 32:
+        raise ValueError(f"Nenhuma sub-rede comporta {quantidade_hosts} hosts.")
+    return 32 - bits_hosts
+
+def alocar_vlsm(bloco_pai, lista_hosts):
+    """
+    Divide um bloco em sub-redes de tamanho variável (VLSM) para as quantidades de hosts pedidas.
+    - Usa um alocador buddy: há uma lista de blocos livres por prefixo e, quando não há
+      bloco livre do tamanho pedido, um bloco maior é dividido ao meio até chegar nele.
+    - Os pedidos são atendidos do maior para o menor, o que evita fragmentação.
+    - Retorna as sub-redes na ordem dos pedidos, com o campo extra "Hosts Solicitados".
+    """
+    rede_pai, prefixo_pai = separar_bloco_cidr(bloco_pai)
+    blocos_livres = {prefixo: [] for prefixo in range(prefixo_pai, 33)}
+    blocos_livres[prefixo_pai].append(rede_pai)
+
+    pedidos = sorted(range(len(lista_hosts)), key=lambda indice: prefixo_para_hosts(lista_hosts[indice]))
+    alocadas = [None] * len(lista_hosts)
+    for indice in pedidos:
+        prefixo = prefixo_para_hosts(lista_hosts[indice])
+
+        # Procura o menor bloco livre que comporta o pedido
+        prefixo_livre = prefixo
+        while prefixo_livre >= prefixo_pai and not blocos_livres.get(prefixo_livre):
+            prefixo_livre -= 1
+        if prefixo_livre < prefixo_pai:
+            raise ValueError(f"Espaço insuficiente em {bloco_pai} para {lista_hosts[indice]} hosts.")
+        rede = heapq.heappop(blocos_livres[prefixo_livre])
+
+        # Divide o bloco ao meio até o tamanho pedido, liberando a metade superior
+        while prefixo_livre < prefixo:
+            prefixo_livre += 1
+            heapq.heappush(blocos_livres[prefixo_livre], rede + (1 << (32 - prefixo_livre)))
+
+        subrede = gerar_informacoes_subrede(converter_inteiro_ip(rede), prefixo)
+        subrede["Hosts Solicitados"] = lista_hosts[indice]
+        alocadas[indice] = subrede
+    return alocadas
+
+def verificar_sobreposicoes(blocos_cidr):
+    """
+    Encontra blocos CIDR que se sobrepõem em O(n log n).
+    - Ordena os blocos pelo endereço inicial e percorre a lista uma vez, guardando o
+      bloco já visto que termina mais adiante.
+    - Cada bloco que começa antes desse fim é reportado junto com ele.
+    - Retorna uma lista de pares (bloco anterior, bloco sobreposto).
+    """
+    intervalos = []
+    for bloco_cidr in blocos_cidr:
+        rede, prefixo = separar_bloco_cidr(bloco_cidr)
+        intervalos.append((rede, rede | (~MASCARAS_INTEIRAS[prefixo] & 0xFFFFFFFF), bloco_cidr))
+    intervalos.sort()
+
+    sobreposicoes = []
+    maior_fim, bloco_maior_fim = -1, None
+    for inicio, fim, bloco_cidr in intervalos:
+        if inicio <= maior_fim:
+            sobreposicoes.append((bloco_maior_fim, bloco_cidr))
+        if fim > maior_fim:
+            maior_fim, bloco_maior_fim = fim, bloco_cidr
+    return sobreposicoes
+
+def _planejar_site(plano):
+    """
+    Executa o planejamento VLSM de um site, devolvendo o erro em vez de interrompê-lo.
+    """
+    bloco_pai, lista_hosts = plano
+    try:
+        return {"Bloco": bloco_pai, "Sub-redes": alocar_vlsm(bloco_pai, lista_hosts)}
+    except ValueError as erro:
+        return {"Bloco": bloco_pai, "Erro": str(erro)}
+
+def planejar_varios_sites(planos, processos=None):
+    """
+    Planeja o endereçamento de muitos sites em paralelo.
+    - `planos` é uma lista de pares (bloco pai, lista de quantidades de hosts).
+    - Os sites são distribuídos entre um pool de processos.
+    - Retorna, na ordem dos planos, um dicionário por site com as sub-redes ou o erro.
+    """
+    processos = processos or os.cpu_count() or 1
+    if processos == 1 or len(planos) < 2:
+        return [_planejar_site(plano) for plano in planos]
+    with ProcessPoolExecutor(processos) as executor:
+        return list(executor.map(_planejar_site, planos, chunksize=max(1, len(planos) // (processos * 4))))
+
+# =============== Cálculo Vetorizado (NumPy) ===============
+
+def exigir_numpy():
+    """
+    Garante que a biblioteca NumPy está disponível para o cálculo vetorizado.
+    """
+    if np is None:
+        raise ImportError("O cálculo vetorizado requer a biblioteca NumPy (pip install numpy).")
+
+def converter_ips_array(enderecos):
+    """
+    Converte uma sequência de endereços IP em um array NumPy `uint32`.
+    - Cada endereço é validado antes da conversão.
+    """
+    exigir_numpy()
+    return np.fromiter(
+        (converter_ip_inteiro(verificar_endereco_ip(endereco)) for endereco in enderecos),
+        dtype=np.uint32
+    )
+
+def gerar_informacoes_subrede_vetorizado(enderecos, prefixo):
+    """
+    Calcula as informações de sub-rede de muitos endereços de uma só vez.
+    - `enderecos` é um array `uint32` (veja `converter_ips_array`).
+    - `prefixo` é um inteiro ou uma sequência de prefixos (por exemplo, range(24, 31));
+      com uma sequência, cada array do resultado ganha uma primeira dimensão por prefixo.
+    - Retorna um dicionário de arrays com as mesmas chaves de `gerar_informacoes_subrede`
+      (exceto CIDR e Máscara Binária), com os endereços como inteiros `uint32`.
+    """
+    exigir_numpy()
+    enderecos = np.asarray(enderecos, dtype=np.uint32)
+    prefixos = np.asarray(prefixo, dtype=np.int64)
+    if prefixos.min(initial=0) < 0 or prefixos.max(initial=0) > 32:
+        raise ValueError("Prefixo de rede inválido. Deve estar entre 0 e 32.")
+
+    # Com vários prefixos, as máscaras viram uma coluna e o NumPy combina cada
+    # prefixo com todos os endereços
+    mascaras = np.array(MASCARAS_INTEIRAS, dtype=np.uint32)[prefixos]
+    if prefixos.ndim:
+        mascaras = mascaras.reshape(mascaras.shape + (1,) * enderecos.ndim)
+
+    rede = enderecos & mascaras
+    broadcast = rede | ~mascaras
+    total_hosts = (np.int64(1) << (32 - prefixos)) - 2
+
+    return {
+        "Endereço da Rede": rede,
+        "Primeiro Host": rede | np.uint32(1),
+        "Último Host": broadcast & np.uint32(0xFFFFFFFE),
+        "Broadcast": broadcast,
+        "Máscara de Rede": np.broadcast_to(mascaras, rede.shape),
+        "Total de Hosts": np.broadcast_to(total_hosts.reshape(mascaras.shape), rede.shape)
+    }
+
 # ================== Funções de Entrada e Saída ==================
 
 def salvar_em_json(dados, arquivo):
@@ -147,6 +370,224 @@ def mostrar_em_tabela(lista_dados):
     
     print(tabulate(linhas_tabela, headers=cabecalhos, tablefmt="grid"))
 
+# ===================== Processamento em Lote ======================
+
+def ler_enderecos_lote(linhas):
+    """
+    Lê endereços de um iterável de linhas, sem carregá-las todas na memória.
+    - Cada linha contém um endereço IP ("192.168.0.1") ou um bloco CIDR ("192.168.0.1/24").
+    - Linhas vazias são ignoradas.
+    - Gera tuplas (número da linha, endereço, prefixo ou None, erro ou None).
+    """
+    for numero_linha, linha in enumerate(linhas, start=1):
+        linha = linha.strip()
+        if not linha:
+            continue
+        endereco, _, prefixo = linha.partition("/")
+        try:
+            verificar_endereco_ip(endereco)
+            if prefixo:
+                if not prefixo.isdigit():
+                    raise ValueError("Prefixo de rede inválido. Deve estar entre 0 e 32.")
+                prefixo = validar_prefixo_rede(int(prefixo))
+            yield numero_linha, endereco, (prefixo if prefixo != "" else None), None
+        except ValueError as erro:
+            yield numero_linha, linha, None, str(erro)
+
+def processar_lote(linhas, saida, prefixo_inicio=None, prefixo_fim=None):
+    """
+    Calcula as sub-redes de cada endereço lido e grava o resultado em JSON Lines.
+    - Cada linha de saída é gravada assim que calculada, então o uso de memória não
+      depende do tamanho da entrada.
+    - Endereços em formato CIDR usam o próprio prefixo; os demais usam o intervalo
+      de prefixos informado.
+    - Linhas inválidas são relatadas em stderr e não interrompem o processamento.
+    - Retorna a quantidade de endereços processados e de linhas com erro.
+    """
+    processados = erros = 0
+    for numero_linha, endereco, prefixo, erro in ler_enderecos_lote(linhas):
+        if erro is None and prefixo is None and prefixo_inicio is None:
+            erro = "Informe o endereço em formato CIDR ou o intervalo de prefixos."
+        if erro is not None:
+            print(f"Linha {numero_linha} ignorada ({endereco}): {erro}", file=sys.stderr)
+            erros += 1
+            continue
+
+        if prefixo is not None:
+            subredes = calcular_varias_subredes(endereco, prefixo, prefixo)
+        else:
+            subredes = calcular_varias_subredes(endereco, prefixo_inicio, prefixo_fim)
+        saida.write(json.dumps({"Endereço IP": endereco, "Sub-redes": subredes}, ensure_ascii=False) + "\n")
+        processados += 1
+    return processados, erros
+
+def programa_lote(arquivo_entrada, arquivo_saida, prefixo_inicio=None, prefixo_fim=None):
+    """
+    Executa o processamento em lote a partir de arquivos.
+    - "-" indica a entrada padrão (stdin) ou a saída padrão (stdout).
+    - O arquivo de saída não pode existir, para evitar sobrescrita.
+    """
+    if prefixo_inicio is not None:
+        validar_prefixo_rede(prefixo_inicio)
+        validar_prefixo_rede(prefixo_fim)
+        if prefixo_inicio > prefixo_fim:
+            raise ValueError("O prefixo inicial deve ser menor ou igual ao final.")
+    if arquivo_saida != "-" and os.path.exists(arquivo_saida):
+        raise FileExistsError(f"O arquivo '{arquivo_saida}' já existe.")
+
+    entrada = sys.stdin if arquivo_entrada == "-" else open(arquivo_entrada, 'r', encoding='utf-8')
+    saida = sys.stdout if arquivo_saida == "-" else open(arquivo_saida, 'x', encoding='utf-8')
+    try:
+        processados, erros = processar_lote(entrada, saida, prefixo_inicio, prefixo_fim)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+    print(f"{processados} endereço(s) processado(s), {erros} linha(s) com erro.", file=sys.stderr)
+    estatisticas = estatisticas_cache_subredes()
+    print(f"Cache de sub-redes: {estatisticas['acertos']} acerto(s), {estatisticas['falhas']} falha(s) "
+          f"({estatisticas['taxa_acerto']:.1%}).", file=sys.stderr)
+
+# ================== Índice de Prefixos (LPM) ==================
+
+class IndicePrefixos:
+    """
+    Árvore binária de prefixos para descobrir a qual sub-rede um endereço pertence.
+    - Cada nível da árvore corresponde a um bit do endereço, do mais significativo
+      para o menos significativo; um bloco /N fica guardado no nível N.
+    - A consulta percorre no máximo 32 níveis e devolve a sub-rede de maior prefixo
+      que contém o endereço (longest prefix match).
+    - Cada nó é uma lista [filho bit 0, filho bit 1, sub-rede guardada ou None].
+    """
+
+    def __init__(self):
+        self.raiz = [None, None, None]
+        self.quantidade = 0
+
+    def inserir(self, rede, prefixo, subrede):
+        """
+        Guarda a sub-rede `rede`/`prefixo` (rede como inteiro de 32 bits).
+        - `subrede` é o valor devolvido nas consultas (normalmente o dicionário
+          de `gerar_informacoes_subrede`). Um bloco repetido é substituído.
+        """
+        no = self.raiz
+        for deslocamento in range(31, 31 - prefixo, -1):
+            bit = (rede >> deslocamento) & 1
+            if no[bit] is None:
+                no[bit] = [None, None, None]
+            no = no[bit]
+        if no[2] is None:
+            self.quantidade += 1
+        no[2] = subrede
+
+    def inserir_cidr(self, bloco_cidr):
+        """
+        Guarda um bloco no formato "192.168.0.0/24", calculando suas informações.
+        """
+        endereco, _, prefixo = bloco_cidr.partition("/")
+        verificar_endereco_ip(endereco)
+        if not prefixo.isdigit():
+            raise ValueError("Prefixo de rede inválido. Deve estar entre 0 e 32.")
+        prefixo = validar_prefixo_rede(int(prefixo))
+        subrede = gerar_informacoes_subrede(endereco, prefixo)
+        self.inserir(converter_ip_inteiro(subrede["Endereço da Rede"]), prefixo, subrede)
+
+    def buscar(self, endereco):
+        """
+        Retorna a sub-rede mais específica que contém o endereço, ou None.
+        - `endereco` pode ser uma string ("10.1.2.3") ou um inteiro de 32 bits.
+        """
+        if isinstance(endereco, str):
+            endereco = converter_ip_inteiro(verificar_endereco_ip(endereco))
+        no = self.raiz
+        encontrada = no[2]
+        for deslocamento in range(31, -1, -1):
+            no = no[(endereco >> deslocamento) & 1]
+            if no is None:
+                break
+            if no[2] is not None:
+                encontrada = no[2]
+        return encontrada
+
+    def buscar_varios(self, enderecos):
+        """
+        Consulta vários endereços, devolvendo uma lista de sub-redes (ou None) na mesma ordem.
+        """
+        buscar = self.buscar
+        return [buscar(endereco) for endereco in enderecos]
+
+    def __len__(self):
+        return self.quantidade
+
+def _ler_registros_json(arquivo):
+    """
+    Gera os registros de um arquivo de resultados, sem carregá-lo inteiro na memória.
+    - Um arquivo que começa com '[' é um documento JSON único (lista de `salvar_em_json`).
+    - Qualquer outro é JSON Lines e é lido uma linha por vez.
+    """
+    with open(arquivo, 'r', encoding='utf-8') as f:
+        primeiro_caractere = ''
+        while True:
+            caractere = f.read(1)
+            if not caractere or not caractere.isspace():
+                primeiro_caractere = caractere
+                break
+        f.seek(0)
+
+        if primeiro_caractere == '[':
+            yield json.load(f)
+            return
+        for linha in f:
+            if linha.strip():
+                yield json.loads(linha)
+
+def carregar_indice_de_json(arquivos):
+    """
+    Monta um índice de prefixos a partir de arquivos de resultados salvos.
+    - Aceita arquivos .json gerados por `salvar_em_json` (lista de sub-redes) e
+      arquivos JSON Lines gerados pelo processamento em lote.
+    """
+    indice = IndicePrefixos()
+    for arquivo in arquivos:
+        for registro in _ler_registros_json(arquivo):
+            if isinstance(registro, dict):
+                registro = registro.get("Sub-redes", [registro])
+            for subrede in registro:
+                prefixo = int(subrede["CIDR"].lstrip("/"))
+                indice.inserir(converter_ip_inteiro(subrede["Endereço da Rede"]), prefixo, subrede)
+    return indice
+
+def programa_consulta(arquivos_indice, arquivo_consultas, arquivo_saida):
+    """
+    Descobre a sub-rede de cada endereço de um arquivo (ou stdin) usando o índice.
+    - Grava um registro JSON Lines por endereço, com a sub-rede encontrada ou null.
+    - O arquivo de saída não pode existir, para evitar sobrescrita.
+    """
+    if arquivo_saida != "-" and os.path.exists(arquivo_saida):
+        raise FileExistsError(f"O arquivo '{arquivo_saida}' já existe.")
+    indice = carregar_indice_de_json(arquivos_indice)
+    print(f"Índice carregado com {len(indice)} bloco(s).", file=sys.stderr)
+
+    entrada = sys.stdin if arquivo_consultas == "-" else open(arquivo_consultas, 'r', encoding='utf-8')
+    saida = sys.stdout if arquivo_saida == "-" else open(arquivo_saida, 'x', encoding='utf-8')
+    try:
+        for numero_linha, linha in enumerate(entrada, start=1):
+            endereco = linha.strip()
+            if not endereco:
+                continue
+            try:
+                subrede = indice.buscar(endereco)
+            except ValueError as erro:
+                print(f"Linha {numero_linha} ignorada ({endereco}): {erro}", file=sys.stderr)
+                continue
+            saida.write(json.dumps({"Endereço IP": endereco, "Sub-rede": subrede}, ensure_ascii=False) + "\n")
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+
 # ===================== Fluxo Principal ======================
 
 def programa_principal():
@@ -210,5 +651,40 @@ def programa_principal():
 
 # ===================== Inicialização do Programa ======================
 
+def main():
+    """
+    Escolhe o modo de execução a partir dos argumentos da linha de comando.
+    - Sem argumentos, executa o programa interativo.
+    - Com --lote, processa um arquivo (ou stdin) com um endereço por linha.
+    - Com --indice e --consultar, descobre a sub-rede de cada endereço de um arquivo.
+    """
+    parser = argparse.ArgumentParser(description="Calculadora de sub-redes.")
+    parser.add_argument("--lote", metavar="ARQUIVO", help="arquivo com um endereço (ou bloco CIDR) por linha; '-' lê de stdin")
+    parser.add_argument("--saida", default="-", metavar="ARQUIVO", help="arquivo JSON Lines de saída; '-' escreve em stdout (padrão)")
+    parser.add_argument("--inicio", type=int, help="prefixo inicial para endereços sem CIDR")
+    parser.add_argument("--fim", type=int, help="prefixo final para endereços sem CIDR (padrão: o inicial)")
+    parser.add_argument("--tamanho-cache", type=int, default=TAMANHO_CACHE_PADRAO, metavar="N",
+                        help=f"sub-redes guardadas no cache (padrão: {TAMANHO_CACHE_PADRAO})")
+    parser.add_argument("--indice", nargs="+", metavar="ARQUIVO", help="arquivos de resultados (.json ou JSON Lines) com as sub-redes conhecidas")
+    parser.add_argument("--consultar", metavar="ARQUIVO", help="arquivo com um endereço por linha a localizar no índice; '-' lê de stdin")
+    argumentos = parser.parse_args()
+
+    if argumentos.lote is None and argumentos.consultar is None:
+        programa_principal()
+        return
+
+    prefixo_fim = argumentos.fim if argumentos.fim is not None else argumentos.inicio
+    try:
+        configurar_cache_subredes(argumentos.tamanho_cache)
+        if argumentos.consultar is not None:
+            if not argumentos.indice:
+                parser.error("--consultar exige --indice.")
+            programa_consulta(argumentos.indice, argumentos.consultar, argumentos.saida)
+        else:
+            programa_lote(argumentos.lote, argumentos.saida, argumentos.inicio, prefixo_fim)
+    except (ValueError, OSError) as erro:
+        print(f"Erro: {erro}", file=sys.stderr)
+        sys.exit(1)
+
 if __name__ == "__main__":
-    programa_principal()
+    main()
@@ -28,60 +28,882 @@ Texto a validarpython minerar.py
 Sua resposta deve ser 3 arquivos: um arquivo com o programa principal, um segundo com a função e
 outras auxiliares, se necessário e o terceiro com a tabela preenchida (em formato doc, PDF ou txt).'''
 
+import argparse
+import asyncio
 import hashlib
+import json
+import multiprocessing
+import os
+import platform
+import struct
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
-def localizar_nonce(entrada_dados: bytes, bits_necessarios_zero: int):
+# Lista de textos para teste e quantidade de bits em zero
+textos_para_testar = [
+    "Esse é fácil", "Esse é fácil", "Esse é fácil", 
+    "Texto maior muda o tempo?", "Texto maior muda o tempo?", "Texto maior muda o tempo?", 
+    "É possível calcular esse?", "É possível calcular esse?", "É possível calcular esse?"
+]
+quantidade_bits_zero = [8, 10, 15, 8, 10, 15, 18, 19, 20]
+
+# O nonce ocupa quatro bytes, então existem 2**32 valores possíveis
+LIMITE_NONCE = 2 ** 32
+
+# Quantidade de nonces que cada tarefa do pool de processos examina
+TAMANHO_FAIXA = 2 ** 16
+
+# Dificuldade até a qual a busca paralela examina a primeira faixa no próprio
+# processo: o nonce costuma aparecer antes de um pool de processos ficar pronto
+BITS_BUSCA_SEQUENCIAL = 16
+
+# Formato do struct usado para escrever o nonce em cada ordem de bytes
+FORMATOS_NONCE = {'little': '<I', 'big': '>I'}
+
+# ===================== Busca Sequencial ======================
+
+def _buscar_faixa(entrada_dados: bytes, bits_necessarios_zero: int, inicio: int, fim: int, ordem_bytes: str = 'little'):
+    """
+    Procura o menor nonce válido no intervalo [inicio, fim) sem criar objetos por iteração.
+
+    O nonce é escrito em um buffer pré-alocado que já contém os dados de entrada, e o
+    teste dos bits iniciais compara o digest diretamente com um limite em bytes: um
+    hash começa com N bits em zero se, e somente se, for menor que 2**(256 - N).
+
+    Args:
+        entrada_dados (bytes): Dados de entrada para o cálculo do hash.
+        bits_necessarios_zero (int): Número de bits iniciais que devem ser zero no hash.
+        inicio (int): Primeiro nonce a testar.
+        fim (int): Nonce final (exclusivo).
+        ordem_bytes (str): Ordem dos bytes do nonce ('little' ou 'big').
+
+    Returns:
+        int | None: O nonce encontrado ou None se o intervalo não tiver resultado.
+    """
+    if not 0 <= bits_necessarios_zero <= 256:
+        raise ValueError("A quantidade de bits em zero deve estar entre 0 e 256.")
+    if bits_necessarios_zero == 0:
+        return inicio if inicio < fim else None
+
+    # Como os dois lados têm 32 bytes, a comparação de bytes equivale à comparação numérica
+    limite_hash = (1 << (256 - bits_necessarios_zero)).to_bytes(32, byteorder='big')
+
+    # Os 4 primeiros bytes do buffer recebem o nonce; o restante é fixo
+    dados_completos = bytearray(4 + len(entrada_dados))
+    dados_completos[4:] = entrada_dados
+    escrever_nonce = struct.Struct(FORMATOS_NONCE[ordem_bytes]).pack_into
+    sha256 = hashlib.sha256
+
+    for contador_nonce in range(inicio, fim):
+        escrever_nonce(dados_completos, 0, contador_nonce)
+        if sha256(dados_completos).digest() < limite_hash:
+            return contador_nonce
+    return None
+
+def localizar_nonce(entrada_dados: bytes, bits_necessarios_zero: int, backend: str = "hashlib"):
     """
     Função para encontrar um nonce que resulta em um hash com os bits iniciais sendo zero.
     
     Args:
         entrada_dados (bytes): Dados de entrada para o cálculo do hash.
         bits_necessarios_zero (int): Número de bits iniciais que devem ser zero no hash.
+        backend (str): Estratégia de busca (ver BACKENDS_MINERACAO) ou "auto".
 
     Returns:
         int: O nonce que satisfaz a condição.
         float: O tempo, em segundos, necessário para encontrar o nonce.
     """
-    contador_nonce = 0
-    inicio_tempo = time.time()
-    
-    while True:
-        # Combinar o nonce com os dados fornecidos
-        dados_nonce = contador_nonce.to_bytes(4, byteorder='little')
-        dados_completos = dados_nonce + entrada_dados
-        
-        # Calcular o hash SHA256
-        hash_gerado = hashlib.sha256(dados_completos).digest()
-        
-        # Converter o hash em bits
-        hash_em_bits = ''.join(f'{byte:08b}' for byte in hash_gerado)
-        
-        # Verificar se os bits iniciais são zeros
-        if hash_em_bits.startswith('0' * bits_necessarios_zero):
-            tempo_total = time.time() - inicio_tempo
-            return contador_nonce, tempo_total
-        
-        # Incrementar o nonce
-        contador_nonce += 1
+    resultado = minerar(entrada_dados, bits_necessarios_zero, backend)
+    return resultado["nonce"], resultado["tempo"]
 
-# Lista de textos para teste e quantidade de bits em zero
-textos_para_testar = [
-    "Esse é fácil", "Esse é fácil", "Esse é fácil", 
-    "Texto maior muda o tempo?", "Texto maior muda o tempo?", "Texto maior muda o tempo?", 
-    "É possível calcular esse?", "É possível calcular esse?", "É possível calcular esse?"
-]
-quantidade_bits_zero = [8, 10, 15, 8, 10, 15, 18, 19, 20]
+# ===================== Busca em Paralelo ======================
+
+# Menor nonce válido já encontrado, compartilhado entre os processos do pool
+_menor_nonce_compartilhado = None
+
+def _inicializar_trabalhador(menor_nonce):
+    """
+    Guarda, em cada processo do pool, a referência ao menor nonce compartilhado.
+    """
+    global _menor_nonce_compartilhado
+    _menor_nonce_compartilhado = menor_nonce
+
+def _verificar_faixa(argumentos):
+    """
+    Procura o menor nonce válido dentro de uma faixa [inicio, fim).
+
+    A busca é abandonada assim que outro processo encontra um nonce menor que o
+    nonce atual, pois nenhum resultado desta faixa seria aproveitado.
+
+    Args:
+        argumentos (tuple): Dados de entrada, bits em zero, início e fim da faixa e ordem dos bytes.
+
+    Returns:
+        int | None: O nonce encontrado ou None se a faixa não tiver resultado.
+    """
+    entrada_dados, bits_necessarios_zero, inicio, fim, ordem_bytes = argumentos
+
+    # Examina a faixa em blocos de 4096 nonces, verificando entre eles se outro
+    # processo já encontrou um nonce menor que o bloco atual
+    for inicio_bloco in range(inicio, fim, 4096):
+        if inicio_bloco > _menor_nonce_compartilhado.value:
+            return None
+
+        contador_nonce = _buscar_faixa(entrada_dados, bits_necessarios_zero, inicio_bloco, min(inicio_bloco + 4096, fim), ordem_bytes)
+        if contador_nonce is not None:
+            # Avisa os demais processos para cancelarem as faixas posteriores
+            with _menor_nonce_compartilhado.get_lock():
+                if contador_nonce < _menor_nonce_compartilhado.value:
+                    _menor_nonce_compartilhado.value = contador_nonce
+            return contador_nonce
+    return None
+
+def _buscar_faixa_paralela(entrada_dados: bytes, bits_necessarios_zero: int, inicio: int, fim: int, ordem_bytes: str = 'little', processos: int = None):
+    """
+    Procura o menor nonce válido no intervalo [inicio, fim) dividindo-o em faixas
+    distribuídas entre um pool de processos.
+
+    As faixas são entregues em ordem crescente e os resultados são lidos na mesma
+    ordem, de modo que o nonce devolvido é sempre o menor nonce válido (o mesmo
+    encontrado pela busca sequencial).
+
+    Args:
+        entrada_dados (bytes): Dados de entrada para o cálculo do hash.
+        bits_necessarios_zero (int): Número de bits iniciais que devem ser zero no hash.
+        inicio (int): Primeiro nonce a testar.
+        fim (int): Nonce final (exclusivo).
+        ordem_bytes (str): Ordem dos bytes do nonce ('little' ou 'big').
+        processos (int): Quantidade de processos do pool (padrão: número de núcleos).
+
+    Returns:
+        int | None: O nonce encontrado ou None se o intervalo não tiver resultado.
+    """
+    # Buscas fáceis e intervalos curtos não compensam o custo de iniciar o pool
+    if bits_necessarios_zero <= BITS_BUSCA_SEQUENCIAL or fim - inicio <= TAMANHO_FAIXA:
+        fim_sequencial = min(inicio + TAMANHO_FAIXA, fim)
+        contador_nonce = _buscar_faixa(entrada_dados, bits_necessarios_zero, inicio, fim_sequencial, ordem_bytes)
+        if contador_nonce is not None or fim_sequencial >= fim:
+            return contador_nonce
+        inicio = fim_sequencial
+
+    processos = processos or os.cpu_count() or 1
+    menor_nonce = multiprocessing.Value('Q', LIMITE_NONCE)
+
+    faixas = (
+        (entrada_dados, bits_necessarios_zero, inicio_faixa, min(inicio_faixa + TAMANHO_FAIXA, fim), ordem_bytes)
+        for inicio_faixa in range(inicio, fim, TAMANHO_FAIXA)
+    )
+
+    # Ao sair do bloco "with", o pool é encerrado e as faixas pendentes são canceladas
+    with multiprocessing.Pool(processos, initializer=_inicializar_trabalhador, initargs=(menor_nonce,)) as pool:
+        for nonce_encontrado in pool.imap(_verificar_faixa, faixas):
+            if nonce_encontrado is not None:
+                return nonce_encontrado
+    return None
+
+def localizar_nonce_paralelo(entrada_dados: bytes, bits_necessarios_zero: int, processos: int = None):
+    """
+    Versão paralela de localizar_nonce, que usa todos os núcleos da máquina.
+
+    Args:
+        entrada_dados (bytes): Dados de entrada para o cálculo do hash.
+        bits_necessarios_zero (int): Número de bits iniciais que devem ser zero no hash.
+        processos (int): Quantidade de processos do pool (padrão: número de núcleos).
+
+    Returns:
+        int: O menor nonce que satisfaz a condição.
+        float: O tempo, em segundos, necessário para encontrar o nonce.
+    """
+    inicio_tempo = time.perf_counter()
+    contador_nonce = _buscar_faixa_paralela(entrada_dados, bits_necessarios_zero, 0, LIMITE_NONCE, processos=processos)
+    if contador_nonce is None:
+        raise ValueError("Nenhum nonce de 4 bytes satisfaz a condição.")
+    return contador_nonce, time.perf_counter() - inicio_tempo
+
+# ===================== Backends de Mineração ======================
+
+# Estratégias de busca disponíveis. Todas recebem (dados, bits, início, fim, ordem dos
+# bytes) e devolvem o menor nonce válido do intervalo, ou None.
+BACKENDS_MINERACAO = {
+    "hashlib": _buscar_faixa,
+    "multiprocessamento": _buscar_faixa_paralela,
+}
+
+# Backend escolhido por escolher_backend(), medido uma única vez por processo
+_backend_automatico = None
+
+def medir_backends(amostra: int = 2 ** 16):
+    """
+    Mede a taxa de hashes por segundo de cada backend nesta máquina.
+
+    Cada backend percorre um intervalo fixo de nonces exigindo 256 bits em zero,
+    condição que nunca é satisfeita, de modo que todos calculam o intervalo inteiro.
+    O multiprocessamento recebe uma faixa por processo para ocupar todos os núcleos.
+
+    Args:
+        amostra (int): Quantidade de nonces medida por backend (por processo, no multiprocessamento).
+
+    Returns:
+        dict: Taxa de hashes por segundo de cada backend.
+    """
+    dados_calibracao = b"calibracao de backends"
+    taxas = {}
+    for nome, buscar in BACKENDS_MINERACAO.items():
+        quantidade = amostra
+        if nome == "multiprocessamento":
+            quantidade = max(amostra, TAMANHO_FAIXA) * (os.cpu_count() or 1)
+
+        inicio_tempo = time.perf_counter()
+        buscar(dados_calibracao, 256, 0, quantidade)
+        taxas[nome] = quantidade / (time.perf_counter() - inicio_tempo)
+    return taxas
+
+def escolher_backend():
+    """
+    Escolhe o backend mais rápido desta máquina, medindo-os na primeira chamada.
+
+    Returns:
+        str: Nome do backend mais rápido.
+    """
+    global _backend_automatico
+    if _backend_automatico is None:
+        taxas = medir_backends()
+        _backend_automatico = max(taxas, key=taxas.get)
+    return _backend_automatico
+
+def minerar(entrada_dados: bytes, bits_necessarios_zero: int, backend: str = "auto",
+            ordem_bytes: str = 'little', arquivo_trabalhos: str = None):
+    """
+    Encontra o menor nonce válido usando o backend pedido e mede o desempenho da busca.
+
+    Se um arquivo de trabalhos for informado, trabalhos já resolvidos são devolvidos
+    sem minerar novamente, e a busca grava um checkpoint a cada TAMANHO_CHECKPOINT
+    nonces, para que uma busca interrompida continue de onde parou.
+
+    Args:
+        entrada_dados (bytes): Dados de entrada para o cálculo do hash.
+        bits_necessarios_zero (int): Número de bits iniciais que devem ser zero no hash.
+        backend (str): Nome de um backend de BACKENDS_MINERACAO ou "auto".
+        ordem_bytes (str): Ordem dos bytes do nonce ('little' ou 'big').
+        arquivo_trabalhos (str): Arquivo JSON Lines de trabalhos (opcional).
+
+    Returns:
+        dict: Nonce, tempo (s), hashes calculados, hashes por segundo, backend usado
+        e se o resultado veio do arquivo de trabalhos.
+    """
+    if ordem_bytes not in FORMATOS_NONCE:
+        raise ValueError("A ordem dos bytes deve ser 'little' ou 'big'.")
+    if backend != "auto" and backend not in BACKENDS_MINERACAO:
+        raise ValueError(f"Backend desconhecido: '{backend}'. Opções: {', '.join(BACKENDS_MINERACAO)}.")
+
+    # Recupera o trabalho salvo: resultado pronto ou último checkpoint
+    chave = chave_trabalho(entrada_dados, bits_necessarios_zero, ordem_bytes)
+    registro = None
+    if arquivo_trabalhos:
+        registro = carregar_trabalhos(arquivo_trabalhos).get(chave)
+    if registro and registro["estado"] == "concluido":
+        return {**registro["resultado"], "em_cache": True}
+
+    # Os backends só são medidos quando a mineração é de fato necessária
+    if backend == "auto":
+        backend = escolher_backend()
+
+    proximo_nonce = registro["proximo_nonce"] if registro else 0
+    tempo_anterior = registro["tempo"] if registro else 0.0
+    tamanho_segmento = TAMANHO_CHECKPOINT if arquivo_trabalhos else LIMITE_NONCE
+
+    inicio_tempo = time.perf_counter()
+    contador_nonce = None
+    while contador_nonce is None and proximo_nonce < LIMITE_NONCE:
+        fim_segmento = min(proximo_nonce + tamanho_segmento, LIMITE_NONCE)
+        contador_nonce = BACKENDS_MINERACAO[backend](entrada_dados, bits_necessarios_zero, proximo_nonce, fim_segmento, ordem_bytes)
+        proximo_nonce = fim_segmento
+
+        if arquivo_trabalhos and contador_nonce is None:
+            registrar_trabalho(arquivo_trabalhos, {
+                "chave": chave,
+                "estado": "parcial",
+                "proximo_nonce": proximo_nonce,
+                "tempo": tempo_anterior + time.perf_counter() - inicio_tempo,
+            })
+    tempo_total = tempo_anterior + time.perf_counter() - inicio_tempo
+    if contador_nonce is None:
+        raise ValueError("Nenhum nonce de 4 bytes satisfaz a condição.")
+
+    # Todos os nonces de 0 até o encontrado precisaram ser testados
+    hashes_calculados = contador_nonce + 1
+    resultado = {
+        "nonce": contador_nonce,
+        "tempo": tempo_total,
+        "hashes": hashes_calculados,
+        "hashes_por_segundo": hashes_calculados / tempo_total if tempo_total > 0 else float("inf"),
+        "backend": backend,
+    }
+    if arquivo_trabalhos:
+        registrar_trabalho(arquivo_trabalhos, {"chave": chave, "estado": "concluido", "resultado": resultado})
+    return {**resultado, "em_cache": False}
+
+# ===================== Armazenamento de Trabalhos ======================
+
+# Arquivo JSON Lines usado pelo programa principal para guardar os trabalhos
+ARQUIVO_TRABALHOS = "trabalhos_mineracao.jsonl"
+
+# Quantidade de nonces examinados entre dois checkpoints
+TAMANHO_CHECKPOINT = 2 ** 24
+
+def chave_trabalho(entrada_dados: bytes, bits_necessarios_zero: int, ordem_bytes: str):
+    """
+    Gera a chave que identifica um trabalho de mineração no arquivo de trabalhos.
+
+    Args:
+        entrada_dados (bytes): Dados de entrada para o cálculo do hash.
+        bits_necessarios_zero (int): Número de bits iniciais que devem ser zero no hash.
+        ordem_bytes (str): Ordem dos bytes do nonce ('little' ou 'big').
+
+    Returns:
+        str: Hash SHA256 dos dados, bits em zero e ordem dos bytes.
+    """
+    return f"{hashlib.sha256(entrada_dados).hexdigest()}:{bits_necessarios_zero}:{ordem_bytes}"
+
+def carregar_trabalhos(arquivo_trabalhos: str):
+    """
+    Lê o arquivo de trabalhos e devolve o registro mais recente de cada trabalho.
+
+    Linhas incompletas (por exemplo, de uma gravação interrompida) são ignoradas.
+
+    Args:
+        arquivo_trabalhos (str): Caminho do arquivo JSON Lines de trabalhos.
+
+    Returns:
+        dict: Último registro de cada trabalho, indexado pela chave.
+    """
+    trabalhos = {}
+    if not os.path.exists(arquivo_trabalhos):
+        return trabalhos
+
+    with open(arquivo_trabalhos, 'r', encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            try:
+                registro = json.loads(linha)
+            except json.JSONDecodeError:
+                continue
+            # Um trabalho concluído nunca volta a ser parcial
+            anterior = trabalhos.get(registro["chave"])
+            if anterior is None or anterior["estado"] != "concluido":
+                trabalhos[registro["chave"]] = registro
+    return trabalhos
+
+def registrar_trabalho(arquivo_trabalhos: str, registro: dict):
+    """
+    Acrescenta um registro (checkpoint ou resultado) ao final do arquivo de trabalhos.
+
+    Args:
+        arquivo_trabalhos (str): Caminho do arquivo JSON Lines de trabalhos.
+        registro (dict): Registro a gravar.
+    """
+    with open(arquivo_trabalhos, 'a', encoding='utf-8') as arquivo:
+        arquivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+
+# ===================== Várias Dificuldades ======================
+
+def contar_bits_zero(entrada_dados: bytes, nonce: int, ordem_bytes: str = 'little'):
+    """
+    Conta quantos bits iniciais do hash de (nonce + dados) são zero.
+
+    Args:
+        entrada_dados (bytes): Dados de entrada para o cálculo do hash.
+        nonce (int): Nonce a combinar com os dados.
+        ordem_bytes (str): Ordem dos bytes do nonce ('little' ou 'big').
+
+    Returns:
+        int: Quantidade de bits iniciais em zero (de 0 a 256).
+    """
+    hash_gerado = hashlib.sha256(nonce.to_bytes(4, byteorder=ordem_bytes) + entrada_dados).digest()
+    return 256 - int.from_bytes(hash_gerado, byteorder='big').bit_length()
+
+def chave_varredura(entrada_dados: bytes, ordem_bytes: str):
+    """
+    Gera a chave do checkpoint da varredura de várias dificuldades de um texto.
+
+    Args:
+        entrada_dados (bytes): Dados de entrada para o cálculo do hash.
+        ordem_bytes (str): Ordem dos bytes do nonce ('little' ou 'big').
+
+    Returns:
+        str: Hash SHA256 dos dados e ordem dos bytes, marcados como varredura.
+    """
+    return f"{hashlib.sha256(entrada_dados).hexdigest()}:varredura:{ordem_bytes}"
+
+def minerar_varias_dificuldades(entrada_dados: bytes, lista_bits_zero: list, backend: str = "auto",
+                                ordem_bytes: str = 'little', arquivo_trabalhos: str = None):
+    """
+    Encontra, em uma única passada pelo espaço de nonces, o primeiro nonce válido
+    para cada quantidade de bits em zero pedida.
+
+    A busca sempre procura o próximo nonce que supere o melhor resultado até agora
+    (maior quantidade de bits em zero). Cada melhoria é registrada e resolve, de uma
+    vez, todas as dificuldades pendentes que ela atende; a varredura continua a partir
+    do nonce seguinte, então o custo total é o da dificuldade mais alta.
+
+    Se um arquivo de trabalhos for informado, a varredura grava um checkpoint do texto
+    a cada TAMANHO_CHECKPOINT nonces e, na próxima chamada, continua de onde parou.
+    Dificuldades já atendidas por uma melhoria do checkpoint são resolvidas sem minerar.
+
+    Args:
+        entrada_dados (bytes): Dados de entrada para o cálculo do hash.
+        lista_bits_zero (list): Quantidades de bits iniciais em zero desejadas.
+        backend (str): Nome de um backend de BACKENDS_MINERACAO ou "auto".
+        ordem_bytes (str): Ordem dos bytes do nonce ('little' ou 'big').
+        arquivo_trabalhos (str): Arquivo JSON Lines de trabalhos (opcional).
+
+    Returns:
+        dict: Resultado de cada dificuldade (no formato de minerar()), o melhor nonce
+        encontrado e o histórico de melhorias (nonce, bits em zero, tempo em s).
+    """
+    if ordem_bytes not in FORMATOS_NONCE:
+        raise ValueError("A ordem dos bytes deve ser 'little' ou 'big'.")
+    if backend != "auto" and backend not in BACKENDS_MINERACAO:
+        raise ValueError(f"Backend desconhecido: '{backend}'. Opções: {', '.join(BACKENDS_MINERACAO)}.")
+
+    # Dificuldades já resolvidas no arquivo de trabalhos não precisam ser mineradas
+    trabalhos = carregar_trabalhos(arquivo_trabalhos) if arquivo_trabalhos else {}
+    resultados = {}
+    for bits_zero in lista_bits_zero:
+        registro = trabalhos.get(chave_trabalho(entrada_dados, bits_zero, ordem_bytes))
+        if registro and registro["estado"] == "concluido":
+            resultados[bits_zero] = {**registro["resultado"], "em_cache": True}
+    pendentes = sorted(set(lista_bits_zero) - set(resultados))
+
+    # Retoma a varredura do último checkpoint deste texto, se houver
+    chave = chave_varredura(entrada_dados, ordem_bytes)
+    checkpoint = trabalhos.get(chave)
+    if checkpoint:
+        proximo_nonce = checkpoint["proximo_nonce"]
+        melhor_bits = checkpoint["melhor_bits"]
+        historico_melhor = [tuple(melhoria) for melhoria in checkpoint["historico_melhor"]]
+        tempo_anterior = checkpoint["tempo"]
+        backend_anterior = checkpoint.get("backend", backend)
+    else:
+        proximo_nonce, melhor_bits, historico_melhor, tempo_anterior = 0, -1, [], 0.0
+        backend_anterior = backend
+
+    def resolver_pendentes(contador_nonce, bits_encontrados, tempo_decorrido, backend_usado):
+        # Uma melhoria resolve todas as dificuldades pendentes que ela atende
+        while pendentes and pendentes[0] <= bits_encontrados:
+            bits_zero = pendentes.pop(0)
+            hashes_calculados = contador_nonce + 1
+            resultado = {
+                "nonce": contador_nonce,
+                "tempo": tempo_decorrido,
+                "hashes": hashes_calculados,
+                "hashes_por_segundo": hashes_calculados / tempo_decorrido if tempo_decorrido > 0 else float("inf"),
+                "backend": backend_usado,
+            }
+            if arquivo_trabalhos:
+                chave_resultado = chave_trabalho(entrada_dados, bits_zero, ordem_bytes)
+                registrar_trabalho(arquivo_trabalhos, {"chave": chave_resultado, "estado": "concluido", "resultado": resultado})
+            resultados[bits_zero] = {**resultado, "em_cache": False}
+
+    # As melhorias já encontradas valem para dificuldades pedidas só agora
+    for contador_nonce, bits_encontrados, tempo_decorrido in historico_melhor:
+        resolver_pendentes(contador_nonce, bits_encontrados, tempo_decorrido, backend_anterior)
+
+    # Os backends só são medidos quando ainda há dificuldades a minerar
+    if pendentes and backend == "auto":
+        backend = escolher_backend()
+
+    tamanho_segmento = TAMANHO_CHECKPOINT if arquivo_trabalhos else LIMITE_NONCE
+    inicio_tempo = time.perf_counter()
+
+    while pendentes:
+        if proximo_nonce >= LIMITE_NONCE:
+            raise ValueError("Nenhum nonce de 4 bytes satisfaz a condição.")
+
+        # Procura, no segmento, o próximo nonce com mais bits em zero que o melhor até agora
+        fim_segmento = min(proximo_nonce + tamanho_segmento, LIMITE_NONCE)
+        contador_nonce = BACKENDS_MINERACAO[backend](entrada_dados, melhor_bits + 1, proximo_nonce, fim_segmento, ordem_bytes)
+        tempo_decorrido = tempo_anterior + time.perf_counter() - inicio_tempo
+
+        if contador_nonce is None:
+            proximo_nonce = fim_segmento
+        else:
+            melhor_bits = contar_bits_zero(entrada_dados, contador_nonce, ordem_bytes)
+            historico_melhor.append((contador_nonce, melhor_bits, tempo_decorrido))
+            proximo_nonce = contador_nonce + 1
+            resolver_pendentes(contador_nonce, melhor_bits, tempo_decorrido, backend)
+
+        if arquivo_trabalhos:
+            registrar_trabalho(arquivo_trabalhos, {
+                "chave": chave,
+                "estado": "parcial",
+                "proximo_nonce": proximo_nonce,
+                "melhor_bits": melhor_bits,
+                "historico_melhor": historico_melhor,
+                "tempo": tempo_decorrido,
+                "backend": backend,
+            })
+
+    melhor = historico_melhor[-1] if historico_melhor else None
+    return {
+        "resultados": resultados,
+        "melhor": {"nonce": melhor[0], "bits_zero": melhor[1]} if melhor else None,
+        "historico_melhor": historico_melhor,
+    }
+
+# ===================== Serviço de Mineração ======================
+
+# Quantidade de nonces de cada tarefa enviada ao pool pelo serviço; a cada
+# tarefa concluída o cliente recebe uma mensagem de progresso
+TAMANHO_SEGMENTO_SERVICO = 2 ** 20
+
+# Tempo máximo (em segundos) que o serviço espera um cliente ler as mensagens
+# pendentes; depois disso a conexão é encerrada e os trabalhos dela, cancelados
+TEMPO_MAXIMO_ENVIO = 30
+
+class ServicoMineracao:
+    """
+    Servidor asyncio que compartilha uma máquina de mineração entre vários clientes.
+
+    O protocolo usa uma mensagem JSON por linha, nos dois sentidos:
+    - {"acao": "minerar", "texto": "...", "bits": 20, "ordem_bytes": "little"}
+      responde {"evento": "aceito", "id": N} e, depois, mensagens "progresso"
+      (nonces testados, hashes por segundo e tempo estimado) até "concluido",
+      "cancelado" ou "erro".
+    - {"acao": "cancelar", "id": N} cancela o trabalho N.
+
+    Cada trabalho é dividido em segmentos executados em um pool de processos, com
+    até um segmento por processo em andamento. No máximo max_trabalhos trabalhos
+    são executados ao mesmo tempo; os demais esperam na fila.
+    """
+
+    def __init__(self, max_trabalhos: int = 2, processos: int = None):
+        self.processos = processos or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(self.processos)
+        self.limite_trabalhos = asyncio.Semaphore(max_trabalhos)
+        self.trabalhos = {}
+        self.proximo_id = 1
+
+    async def tratar_cliente(self, leitor, escritor):
+        """
+        Lê as mensagens de um cliente até a conexão ser fechada. Os trabalhos do
+        cliente que ainda estiverem em andamento são cancelados ao final.
+        """
+        async def enviar(mensagem):
+            if escritor.is_closing():
+                return
+            escritor.write((json.dumps(mensagem, ensure_ascii=False) + "\n").encode('utf-8'))
+            try:
+                await asyncio.wait_for(escritor.drain(), TEMPO_MAXIMO_ENVIO)
+            except asyncio.TimeoutError:
+                # Um cliente que não lê as respostas não pode segurar uma vaga de trabalho
+                escritor.transport.abort()
+            except ConnectionError:
+                pass
+
+        trabalhos_cliente = set()
+
+        def descartar_trabalho(id_trabalho):
+            self.trabalhos.pop(id_trabalho, None)
+            trabalhos_cliente.discard(id_trabalho)
+
+        try:
+            async for linha in leitor:
+                try:
+                    mensagem = json.loads(linha)
+                except json.JSONDecodeError:
+                    await enviar({"evento": "erro", "mensagem": "Mensagem JSON inválida."})
+                    continue
+
+                acao = mensagem.get("acao") if isinstance(mensagem, dict) else None
+                if acao == "minerar":
+                    id_trabalho = self.proximo_id
+                    self.proximo_id += 1
+                    await enviar({"evento": "aceito", "id": id_trabalho})
+
+                    tarefa = asyncio.create_task(self.executar_trabalho(id_trabalho, mensagem, enviar))
+                    tarefa.add_done_callback(lambda _, id_trabalho=id_trabalho: descartar_trabalho(id_trabalho))
+                    self.trabalhos[id_trabalho] = tarefa
+                    trabalhos_cliente.add(id_trabalho)
+                elif acao == "cancelar":
+                    # Um cliente só pode cancelar os próprios trabalhos
+                    id_pedido = mensagem.get("id")
+                    tarefa = None
+                    if isinstance(id_pedido, int) and id_pedido in trabalhos_cliente:
+                        tarefa = self.trabalhos.get(id_pedido)
+                    if tarefa is None:
+                        await enviar({"evento": "erro", "id": mensagem.get("id"), "mensagem": "Trabalho não encontrado."})
+                    else:
+                        tarefa.cancel()
+                else:
+                    await enviar({"evento": "erro", "mensagem": "Ação desconhecida. Use 'minerar' ou 'cancelar'."})
+        finally:
+            for id_trabalho in list(trabalhos_cliente):
+                tarefa = self.trabalhos.get(id_trabalho)
+                if tarefa is not None:
+                    tarefa.cancel()
+            escritor.close()
+
+    async def executar_trabalho(self, id_trabalho: int, mensagem: dict, enviar):
+        """
+        Executa um trabalho de mineração, enviando o progresso ao cliente a cada segmento.
+
+        Os segmentos são lidos na ordem dos nonces, de modo que o nonce devolvido é
+        sempre o menor nonce válido.
+        """
+        loop = asyncio.get_running_loop()
+        segmentos_pendentes = deque()
+        try:
+            texto = mensagem.get("texto")
+            bits_zero = mensagem.get("bits")
+            ordem_bytes = mensagem.get("ordem_bytes", "little")
+            if not isinstance(texto, str):
+                raise ValueError("O campo 'texto' é obrigatório.")
+            if not isinstance(bits_zero, int) or isinstance(bits_zero, bool) or not 0 <= bits_zero <= 256:
+                raise ValueError("O campo 'bits' deve ser um inteiro entre 0 e 256.")
+            if ordem_bytes not in FORMATOS_NONCE:
+                raise ValueError("A ordem dos bytes deve ser 'little' ou 'big'.")
+            dados_em_bytes = texto.encode('utf-8')
+
+            if self.limite_trabalhos.locked():
+                await enviar({"evento": "na_fila", "id": id_trabalho})
+
+            async with self.limite_trabalhos:
+                inicio_tempo = time.perf_counter()
+                proximo_nonce = 0
+                contador_nonce = None
+
+                while contador_nonce is None:
+                    # Mantém um segmento por processo em andamento
+                    while len(segmentos_pendentes) < self.processos and proximo_nonce < LIMITE_NONCE:
+                        fim_segmento = min(proximo_nonce + TAMANHO_SEGMENTO_SERVICO, LIMITE_NONCE)
+                        futuro = loop.run_in_executor(self.executor, _buscar_faixa, dados_em_bytes, bits_zero,
+                                                      proximo_nonce, fim_segmento, ordem_bytes)
+                        segmentos_pendentes.append((fim_segmento, futuro))
+                        proximo_nonce = fim_segmento
+                    if not segmentos_pendentes:
+                        raise ValueError("Nenhum nonce de 4 bytes satisfaz a condição.")
+
+                    fim_segmento, futuro = segmentos_pendentes.popleft()
+                    contador_nonce = await futuro
+                    tempo_decorrido = time.perf_counter() - inicio_tempo
+
+                    nonces_testados = fim_segmento if contador_nonce is None else contador_nonce + 1
+                    taxa = nonces_testados / tempo_decorrido if tempo_decorrido > 0 else 0.0
+                    if contador_nonce is None:
+                        # Em média, são necessários 2**bits hashes para encontrar o nonce
+                        restantes = max(2 ** bits_zero - nonces_testados, 0)
+                        await enviar({
+                            "evento": "progresso",
+                            "id": id_trabalho,
+                            "nonces_testados": nonces_testados,
+                            "hashes_por_segundo": taxa,
+                            "tempo_estimado": restantes / taxa if taxa else None,
+                        })
+
+                await enviar({
+                    "evento": "concluido",
+                    "id": id_trabalho,
+                    "nonce": contador_nonce,
+                    "tempo": tempo_decorrido,
+                    "hashes_por_segundo": taxa,
+                })
+        except asyncio.CancelledError:
+            await enviar({"evento": "cancelado", "id": id_trabalho})
+            raise
+        except ValueError as erro:
+            await enviar({"evento": "erro", "id": id_trabalho, "mensagem": str(erro)})
+        except Exception as erro:
+            # Falhas inesperadas (por exemplo, um processo do pool que morreu) também
+            # encerram o trabalho, para que o cliente não fique esperando para sempre
+            await enviar({"evento": "erro", "id": id_trabalho, "mensagem": f"Falha ao minerar: {erro!r}"})
+        finally:
+            # Segmentos que ainda não começaram são descartados
+            for _, futuro in segmentos_pendentes:
+                futuro.cancel()
+
+    async def servir(self, host: str, porta: int):
+        """
+        Abre o socket e atende clientes até o programa ser interrompido.
+        """
+        servidor = await asyncio.start_server(self.tratar_cliente, host, porta)
+        print(f"Serviço de mineração aguardando conexões em {host}:{porta}.")
+        async with servidor:
+            await servidor.serve_forever()
+
+def executar_servico(host: str = "127.0.0.1", porta: int = 8765, max_trabalhos: int = 2, processos: int = None):
+    """
+    Inicia o serviço de mineração e bloqueia até receber Ctrl+C.
+
+    Args:
+        host (str): Endereço em que o serviço escuta.
+        porta (int): Porta TCP do serviço.
+        max_trabalhos (int): Quantidade máxima de trabalhos executados ao mesmo tempo.
+        processos (int): Quantidade de processos do pool (padrão: número de núcleos).
+    """
+    servico = ServicoMineracao(max_trabalhos, processos)
+    try:
+        asyncio.run(servico.servir(host, porta))
+    except KeyboardInterrupt:
+        print("\nServiço encerrado.")
+    finally:
+        servico.executor.shutdown(cancel_futures=True)
+
+# ===================== Benchmark ======================
+
+def _percentil(amostras_ordenadas: list, percentual: float):
+    """
+    Calcula um percentil por interpolação linear entre as amostras ordenadas.
+    """
+    posicao = (len(amostras_ordenadas) - 1) * percentual / 100
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(amostras_ordenadas) - 1)
+    fracao = posicao - inferior
+    return amostras_ordenadas[inferior] * (1 - fracao) + amostras_ordenadas[superior] * fracao
+
+def executar_benchmark(backends: list = None, casos: list = None, repeticoes: int = 5, aquecimento: int = 1):
+    """
+    Mede o desempenho de cada backend em cada caso (texto, bits em zero).
+
+    Cada caso é executado algumas vezes sem medição (aquecimento) e depois repetido,
+    registrando os hashes por segundo de cada repetição medidos com perf_counter.
+
+    Args:
+        backends (list): Nomes dos backends a medir (padrão: todos).
+        casos (list): Pares (texto, bits em zero) (padrão: a tabela de testes, sem repetições).
+        repeticoes (int): Quantidade de execuções medidas por caso.
+        aquecimento (int): Quantidade de execuções descartadas por caso.
+
+    Returns:
+        dict: Informações da máquina e estatísticas (mediana, p10, p90, mínimo e máximo
+        de hashes por segundo e mediana do tempo) de cada backend e caso.
+    """
+    if repeticoes < 1:
+        raise ValueError("O benchmark precisa de pelo menos uma repetição.")
+    backends = backends or list(BACKENDS_MINERACAO)
+    casos = casos or list(dict.fromkeys(zip(textos_para_testar, quantidade_bits_zero)))
+
+    resultados = []
+    for backend in backends:
+        for texto, bits_zero in casos:
+            dados_em_bytes = texto.encode('utf-8')
+            for _ in range(aquecimento):
+                minerar(dados_em_bytes, bits_zero, backend)
+
+            execucoes = [minerar(dados_em_bytes, bits_zero, backend) for _ in range(repeticoes)]
+            taxas = sorted(execucao["hashes_por_segundo"] for execucao in execucoes)
+            tempos = sorted(execucao["tempo"] for execucao in execucoes)
+            resultados.append({
+                "backend": backend,
+                "texto": texto,
+                "bits_zero": bits_zero,
+                "nonce": execucoes[0]["nonce"],
+                "repeticoes": repeticoes,
+                "tempo_mediano": _percentil(tempos, 50),
+                "hashes_por_segundo": {
+                    "mediana": _percentil(taxas, 50),
+                    "p10": _percentil(taxas, 10),
+                    "p90": _percentil(taxas, 90),
+                    "minimo": taxas[0],
+                    "maximo": taxas[-1],
+                },
+            })
+
+    return {
+        "maquina": {
+            "plataforma": platform.platform(),
+            "python": platform.python_version(),
+            "nucleos": os.cpu_count(),
+        },
+        "repeticoes": repeticoes,
+        "aquecimento": aquecimento,
+        "resultados": resultados,
+    }
+
+def mostrar_benchmark(relatorio: dict):
+    """
+    Exibe o relatório do benchmark em formato de tabela.
+
+    Args:
+        relatorio (dict): Relatório gerado por executar_benchmark().
+    """
+    print(f"{'Backend':<20} {'Texto':<30} {'Bits':<6} {'Tempo (s)':<12} {'Mediana H/s':<15} {'p10 H/s':<15} {'p90 H/s':<15}")
+    for resultado in relatorio["resultados"]:
+        taxas = resultado["hashes_por_segundo"]
+        print(f"{resultado['backend']:<20} {resultado['texto']:<30} {resultado['bits_zero']:<6} "
+              f"{resultado['tempo_mediano']:<12.4f} {taxas['mediana']:<15,.0f} {taxas['p10']:<15,.0f} {taxas['p90']:<15,.0f}")
+
+def salvar_benchmark(relatorio: dict, arquivo: str):
+    """
+    Salva o relatório do benchmark em um arquivo JSON, sem sobrescrever arquivos existentes.
+
+    Args:
+        relatorio (dict): Relatório gerado por executar_benchmark().
+        arquivo (str): Caminho do arquivo JSON.
+    """
+    if os.path.exists(arquivo):
+        raise FileExistsError(f"O arquivo '{arquivo}' já existe.")
+    with open(arquivo, 'w', encoding='utf-8') as destino:
+        json.dump(relatorio, destino, indent=4, ensure_ascii=False)
+
+# ===================== Programa Principal ======================
+
+def main():
+    """
+    Preenche e exibe a tabela de nonces para os textos de teste. Com a opção
+    --servidor, inicia o serviço de mineração; com --benchmark, mede os backends.
+    """
+    parser = argparse.ArgumentParser(description="Mineração de nonces por prova de trabalho.")
+    parser.add_argument("--servidor", action="store_true", help="inicia o serviço de mineração")
+    parser.add_argument("--host", default="127.0.0.1", help="endereço do serviço (padrão: 127.0.0.1)")
+    parser.add_argument("--porta", type=int, default=8765, help="porta do serviço (padrão: 8765)")
+    parser.add_argument("--max-trabalhos", type=int, default=2, help="trabalhos simultâneos no serviço (padrão: 2)")
+    parser.add_argument("--benchmark", action="store_true", help="mede o desempenho de cada backend na tabela de testes")
+    parser.add_argument("--repeticoes", type=int, default=5, help="execuções medidas por caso no benchmark (padrão: 5)")
+    parser.add_argument("--aquecimento", type=int, default=1, help="execuções descartadas por caso no benchmark (padrão: 1)")
+    parser.add_argument("--saida-json", help="arquivo JSON do relatório de benchmark")
+    argumentos = parser.parse_args()
+
+    if argumentos.servidor:
+        executar_servico(argumentos.host, argumentos.porta, argumentos.max_trabalhos)
+        return
+
+    if argumentos.benchmark:
+        arquivo_json = argumentos.saida_json or time.strftime("benchmark_mineracao_%Y%m%d_%H%M%S.json")
+        if os.path.exists(arquivo_json):
+            print(f"Erro: O arquivo '{arquivo_json}' já existe.")
+            return
+        relatorio = executar_benchmark(repeticoes=argumentos.repeticoes, aquecimento=argumentos.aquecimento)
+        mostrar_benchmark(relatorio)
+        salvar_benchmark(relatorio, arquivo_json)
+        print(f"\nRelatório salvo no arquivo {arquivo_json}.")
+        return
+
+    # Tabela para armazenar os resultados
+    tabela_resultados = []
+
+    # Agrupa as dificuldades de cada texto para minerá-las em uma única passada
+    bits_por_texto = {}
+    for texto, bits_zero in zip(textos_para_testar, quantidade_bits_zero):
+        bits_por_texto.setdefault(texto, []).append(bits_zero)
+
+    resultados_por_texto = {
+        texto: minerar_varias_dificuldades(texto.encode('utf-8'), lista_bits, arquivo_trabalhos=ARQUIVO_TRABALHOS)["resultados"]
+        for texto, lista_bits in bits_por_texto.items()
+    }
+
+    for texto, bits_zero in zip(textos_para_testar, quantidade_bits_zero):
+        resultado = resultados_por_texto[texto][bits_zero]
+        tabela_resultados.append((texto, bits_zero, resultado["nonce"], resultado["tempo"], resultado["hashes_por_segundo"]))
 
-# Tabela para armazenar os resultados
-tabela_resultados = []
+    print(f"Resultados guardados em '{ARQUIVO_TRABALHOS}'.\n")
 
-for texto, bits_zero in zip(textos_para_testar, quantidade_bits_zero):
-    dados_em_bytes = texto.encode('utf-8')
-    nonce_encontrado, tempo_decorrido = localizar_nonce(dados_em_bytes, bits_zero)
-    tabela_resultados.append((texto, bits_zero, nonce_encontrado, tempo_decorrido))
+    # Exibir os resultados em formato de tabela
+    print(f"{'Texto':<30} {'Bits em Zero':<15} {'Nonce':<15} {'Tempo (s)':<15} {'Hashes/s':<15}")
+    for resultado in tabela_resultados:
+        print(f"{resultado[0]:<30} {resultado[1]:<15} {resultado[2]:<15} {resultado[3]:<15.4f} {resultado[4]:<15,.0f}")
 
-# Exibir os resultados em formato de tabela
-print(f"{'Texto':<30} {'Bits em Zero':<15} {'Nonce':<15} {'Tempo (s)':<15}")
-for resultado in tabela_resultados:
-    print(f"{resultado[0]:<30} {resultado[1]:<15} {resultado[2]:<15} {resultado[3]:<15.4f}")
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,18 @@ o Se o usuário não conseguir adivinhar a palavra em 6 tentativas, o programa d
 palavra e informar que o usuário perdeu.
 '''
 
+import asyncio
+import hashlib
+import marshal
+import os
 import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # Sem NumPy, apenas o resolvedor e a simulação ficam indisponíveis
+    np = None
 
 def main():
     """
@@ -35,12 +46,33 @@ def main():
     # Nome do arquivo contendo as palavras
     nome_arquivo_palavras = "palavras.txt"
 
+    # Modo servidor: python Termo_3.py --servidor [porta]
+    if len(sys.argv) > 1 and sys.argv[1] == "--servidor":
+        try:
+            porta = int(sys.argv[2]) if len(sys.argv) > 2 else 8023
+        except ValueError:
+            porta = -1
+        if not 0 < porta < 65536:
+            print("Erro: A porta deve ser um número entre 1 e 65535.")
+            return
+        executar_servidor(nome_arquivo_palavras, porta=porta)
+        return
+
+    # Modo de simulação: python Termo_3.py --simular [arquivo_de_palavras]
+    modo_simulacao = len(sys.argv) > 1 and sys.argv[1] == "--simular"
+    if modo_simulacao and len(sys.argv) > 2:
+        nome_arquivo_palavras = sys.argv[2]
+
     # Carrega as palavras do arquivo
     palavras_disponiveis = carregar_palavras(nome_arquivo_palavras)
     if not palavras_disponiveis:
         print("Erro: Nenhuma palavra válida foi encontrada no arquivo.")
         return
 
+    if modo_simulacao:
+        mostrar_resumo_simulacao(simular_lista(palavras_disponiveis))
+        return
+
     # Seleciona uma palavra aleatória e inicia o jogo
     palavra_sorteada = selecionar_palavra_aleatoria(palavras_disponiveis)
     executar_jogo(palavra_sorteada)
@@ -89,6 +121,7 @@ def executar_jogo(palavra_escolhida):
         palavra_escolhida (str): Palavra que o jogador deve adivinhar.
     """
     tentativas_restantes = 6
+    contagem_alvo = indexar_palavra(palavra_escolhida)
 
     while tentativas_restantes > 0:
         print(f"\nTentativas restantes: {tentativas_restantes}")
@@ -105,7 +138,8 @@ def executar_jogo(palavra_escolhida):
             return
 
         # Fornece feedback sobre a tentativa
-        print(f"Feedback: {avaliar_tentativa(palavra_escolhida, tentativa)}")
+        padrao = calcular_padrao(palavra_escolhida, tentativa, contagem_alvo)
+        print(f"Feedback: {renderizar_feedback(tentativa, padrao)}")
 
         # Reduz o número de tentativas restantes
         tentativas_restantes -= 1
@@ -113,6 +147,115 @@ def executar_jogo(palavra_escolhida):
     # Se o jogador não acertar em 6 tentativas
     print(f"\nVocê perdeu! A palavra correta era: '{palavra_escolhida}'.")
 
+# Códigos de cada letra no padrão de feedback (um dígito na base 3 por posição)
+CINZA, AMARELO, VERDE = 0, 1, 2
+
+# Cor ANSI usada para exibir cada código de feedback
+CORES_FEEDBACK = {
+    VERDE: "\033[92m",    # Verde: posição correta
+    AMARELO: "\033[93m",  # Amarelo: presente, mas em posição errada
+    CINZA: "\033[90m",    # Cinza: letra ausente
+}
+
+def indexar_palavra(palavra):
+    """
+    Conta quantas vezes cada letra aparece na palavra.
+    
+    Args:
+        palavra (str): Palavra a indexar (normalmente a palavra sorteada).
+    
+    Returns:
+        dict: Quantidade de ocorrências de cada letra.
+    """
+    contagem = {}
+    for letra in palavra:
+        contagem[letra] = contagem.get(letra, 0) + 1
+    return contagem
+
+def calcular_padrao(palavra_alvo, tentativa_usuario, contagem_alvo=None):
+    """
+    Calcula o feedback de uma tentativa como um número inteiro compacto.
+
+    Cada posição i contribui com código * 3**i, em que o código é VERDE, AMARELO ou
+    CINZA. Letras repetidas respeitam a quantidade de ocorrências na palavra alvo:
+    as verdes são marcadas primeiro e cada letra só fica amarela enquanto ainda
+    houver ocorrências dela não utilizadas.
+    
+    Args:
+        palavra_alvo (str): Palavra correta que o jogador precisa adivinhar.
+        tentativa_usuario (str): Palavra fornecida pelo jogador (mesmo tamanho da alvo).
+        contagem_alvo (dict): Resultado de indexar_palavra(palavra_alvo), calculado
+            uma vez por jogo (opcional).
+    
+    Returns:
+        int: Padrão de feedback codificado.
+    """
+    ocorrencias_restantes = dict(contagem_alvo or indexar_palavra(palavra_alvo))
+    padrao = 0
+    peso = 1
+    letras_fora_do_lugar = []
+
+    # Primeiro as letras na posição correta, que consomem suas ocorrências
+    for letra_alvo, letra in zip(palavra_alvo, tentativa_usuario):
+        if letra == letra_alvo:
+            padrao += VERDE * peso
+            ocorrencias_restantes[letra] -= 1
+        else:
+            letras_fora_do_lugar.append((peso, letra))
+        peso *= 3
+
+    # Depois as letras presentes em outra posição, enquanto houver ocorrências
+    for peso, letra in letras_fora_do_lugar:
+        if ocorrencias_restantes.get(letra, 0) > 0:
+            padrao += AMARELO * peso
+            ocorrencias_restantes[letra] -= 1
+    return padrao
+
+def padrao_vitoria(tamanho_palavra):
+    """
+    Retorna o padrão em que todas as letras estão na posição correta.
+    
+    Args:
+        tamanho_palavra (int): Quantidade de letras da palavra.
+    
+    Returns:
+        int: Padrão com VERDE em todas as posições.
+    """
+    return 3 ** tamanho_palavra - 1
+
+def decodificar_padrao(padrao, tamanho_palavra):
+    """
+    Converte um padrão codificado na lista de códigos de cada posição.
+    
+    Args:
+        padrao (int): Padrão de feedback codificado.
+        tamanho_palavra (int): Quantidade de letras da palavra.
+    
+    Returns:
+        list: Código (VERDE, AMARELO ou CINZA) de cada letra.
+    """
+    codigos = []
+    for _ in range(tamanho_palavra):
+        padrao, codigo = divmod(padrao, 3)
+        codigos.append(codigo)
+    return codigos
+
+def renderizar_feedback(tentativa_usuario, padrao):
+    """
+    Monta o texto colorido de uma tentativa a partir do padrão de feedback.
+    
+    Args:
+        tentativa_usuario (str): Palavra fornecida pelo jogador.
+        padrao (int): Padrão de feedback codificado.
+    
+    Returns:
+        str: Feedback com cores (verde, amarelo, cinza) para cada letra.
+    """
+    codigos = decodificar_padrao(padrao, len(tentativa_usuario))
+    return " ".join(
+        f"{CORES_FEEDBACK[codigo]}{letra}\033[0m" for letra, codigo in zip(tentativa_usuario, codigos)
+    )
+
 def avaliar_tentativa(palavra_alvo, tentativa_usuario):
     """
     Avalia a tentativa do jogador e retorna um feedback indicando as posições corretas e incorretas.
@@ -124,15 +267,470 @@ def avaliar_tentativa(palavra_alvo, tentativa_usuario):
     Returns:
         str: Feedback com cores (verde, amarelo, cinza) para cada letra.
     """
-    feedback = []
-    for indice, letra in enumerate(tentativa_usuario):
-        if letra == palavra_alvo[indice]:
-            feedback.append(f"\033[92m{letra}\033[0m")  # Verde: posição correta
-        elif letra in palavra_alvo:
-            feedback.append(f"\033[93m{letra}\033[0m")  # Amarelo: presente, mas em posição errada
-        else:
-            feedback.append(f"\033[90m{letra}\033[0m")  # Cinza: letra ausente
-    return " ".join(feedback)
+    return renderizar_feedback(tentativa_usuario, calcular_padrao(palavra_alvo, tentativa_usuario))
+
+# Quantidade máxima de tentativas de cada jogo
+MAXIMO_TENTATIVAS = 6
+
+def agrupar_por_tamanho(lista_palavras):
+    """
+    Separa as palavras pela quantidade de letras, sem repetições e em ordem alfabética.
+    
+    Args:
+        lista_palavras (list): Palavras carregadas por carregar_palavras.
+    
+    Returns:
+        dict: Lista de palavras de cada tamanho.
+    """
+    grupos = {}
+    for palavra in sorted(set(lista_palavras)):
+        grupos.setdefault(len(palavra), []).append(palavra)
+    return grupos
+
+def calcular_matriz_padroes(lista_palavras, linhas_por_bloco=128):
+    """
+    Calcula o padrão de feedback de cada par (tentativa, resposta) com NumPy.
+
+    As palavras devem ter o mesmo tamanho. O resultado é idêntico ao de chamar
+    calcular_padrao para cada par, mas é calculado em blocos de tentativas de uma vez.
+    
+    Args:
+        lista_palavras (list): Palavras de mesmo tamanho (usadas como tentativas e respostas).
+        linhas_por_bloco (int): Quantidade de tentativas processadas por bloco.
+    
+    Returns:
+        numpy.ndarray: Matriz uint16 com o padrão de [tentativa, resposta].
+    """
+    exigir_numpy()
+    tamanho = len(lista_palavras[0])
+    alfabeto = {letra: indice for indice, letra in enumerate(sorted(set("".join(lista_palavras))))}
+    letras = np.array([[alfabeto[letra] for letra in palavra] for palavra in lista_palavras], dtype=np.intp)
+    quantidade = len(lista_palavras)
+    pesos = 3 ** np.arange(tamanho)
+    matriz = np.empty((quantidade, quantidade), dtype=np.uint16)
+    respostas = np.arange(quantidade)
+
+    for inicio in range(0, quantidade, linhas_por_bloco):
+        tentativas = letras[inicio:inicio + linhas_por_bloco]
+        linhas = np.arange(len(tentativas))[:, None]
+        verde = tentativas[:, None, :] == letras[None, :, :]
+
+        # Ocorrências de cada letra da resposta que não foram usadas por uma verde
+        restantes = np.zeros((len(tentativas), quantidade, len(alfabeto)), dtype=np.int8)
+        for posicao in range(tamanho):
+            restantes[:, respostas, letras[:, posicao]] += ~verde[:, :, posicao]
+
+        padroes = (verde * (VERDE * pesos)).sum(axis=2)
+        for posicao in range(tamanho):
+            letra = tentativas[:, posicao][:, None]
+            amarelo = ~verde[:, :, posicao] & (restantes[linhas, respostas, letra] > 0)
+            padroes += amarelo * (AMARELO * pesos[posicao])
+            restantes[linhas, respostas, letra] -= amarelo
+        matriz[inicio:inicio + linhas_por_bloco] = padroes
+    return matriz
+
+def carregar_matriz_padroes(lista_palavras, diretorio_cache="."):
+    """
+    Carrega do disco a matriz de padrões de uma lista de palavras, calculando-a se necessário.
+
+    O nome do arquivo de cache inclui o tamanho das palavras e um hash da lista, então
+    qualquer alteração na lista gera uma nova matriz.
+    
+    Args:
+        lista_palavras (list): Palavras de mesmo tamanho, em ordem.
+        diretorio_cache (str): Pasta onde as matrizes são guardadas.
+    
+    Returns:
+        numpy.ndarray: Matriz uint16 com o padrão de [tentativa, resposta].
+    """
+    exigir_numpy()
+    resumo = hashlib.sha256("\n".join(lista_palavras).encode('utf-8')).hexdigest()[:16]
+    arquivo_cache = os.path.join(diretorio_cache, f"padroes_termo_{len(lista_palavras[0])}_{resumo}.npy")
+    if os.path.exists(arquivo_cache):
+        return np.load(arquivo_cache, mmap_mode='r')
+
+    matriz = calcular_matriz_padroes(lista_palavras)
+    os.makedirs(diretorio_cache, exist_ok=True)
+    # Grava em um arquivo temporário para que outro processo nunca leia uma matriz incompleta
+    arquivo_temporario = f"{arquivo_cache}.{os.getpid()}.tmp"
+    with open(arquivo_temporario, 'wb') as arquivo:
+        np.save(arquivo, matriz)
+    os.replace(arquivo_temporario, arquivo_cache)
+    return matriz
+
+def exigir_numpy():
+    """
+    Garante que a biblioteca NumPy está disponível para o resolvedor.
+    """
+    if np is None:
+        raise ImportError("O resolvedor requer a biblioteca NumPy (pip install numpy).")
+
+class ResolvedorTermo:
+    """
+    Resolvedor que escolhe as tentativas pela informação esperada (entropia).
+
+    Usa a matriz de padrões de uma lista de palavras de mesmo tamanho: cada tentativa
+    divide as respostas ainda possíveis em grupos pelo padrão que elas produziriam, e a
+    melhor tentativa é a que maximiza a entropia dessa divisão.
+    """
+
+    def __init__(self, lista_palavras, matriz_padroes, primeira_tentativa=None):
+        self.palavras = list(lista_palavras)
+        self.indices = {palavra: indice for indice, palavra in enumerate(self.palavras)}
+        self.matriz = matriz_padroes
+        self.tamanho = len(self.palavras[0])
+        self.quantidade_padroes = 3 ** self.tamanho
+        self.primeira_tentativa = primeira_tentativa
+
+    def entropias(self, candidatos):
+        """
+        Calcula a informação esperada (em bits) de cada tentativa para os candidatos dados.
+        
+        Args:
+            candidatos (numpy.ndarray): Índices das respostas ainda possíveis.
+        
+        Returns:
+            numpy.ndarray: Entropia de cada palavra usada como tentativa.
+        """
+        entropias = np.empty(len(self.palavras))
+        # Cada bloco de linhas conta os padrões de várias tentativas com um único bincount.
+        # O bloco é limitado tanto pelas contagens (linhas x padrões) quanto pelos pares
+        # (linhas x candidatos), para que o uso de memória não cresça com a lista
+        linhas_por_bloco = max(1, min(2 ** 22 // self.quantidade_padroes, 2 ** 24 // len(candidatos)))
+        for inicio in range(0, len(self.palavras), linhas_por_bloco):
+            # Com no máximo 2**22 contagens por bloco, os índices cabem em int32
+            padroes = self.matriz[inicio:inicio + linhas_por_bloco][:, candidatos].astype(np.int32)
+            padroes += np.arange(len(padroes), dtype=np.int32)[:, None] * self.quantidade_padroes
+            contagens = np.bincount(padroes.ravel(), minlength=len(padroes) * self.quantidade_padroes)
+            probabilidades = contagens.reshape(len(padroes), self.quantidade_padroes) / len(candidatos)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                termos = np.where(probabilidades > 0, probabilidades * np.log2(probabilidades), 0.0)
+            entropias[inicio:inicio + linhas_por_bloco] = -termos.sum(axis=1)
+        return entropias
+
+    def melhor_tentativa(self, candidatos):
+        """
+        Escolhe a próxima tentativa. Em caso de empate, prefere uma resposta possível.
+        
+        Args:
+            candidatos (numpy.ndarray): Índices das respostas ainda possíveis.
+        
+        Returns:
+            int: Índice da palavra escolhida.
+        """
+        if len(candidatos) <= 2:
+            return int(candidatos[0])
+        pontuacao = self.entropias(candidatos)
+        pontuacao[candidatos] += 1e-9
+        return int(np.argmax(pontuacao))
+
+    def resolver(self, palavra_alvo, maximo_tentativas=None):
+        """
+        Joga uma partida contra a palavra alvo.
+        
+        Args:
+            palavra_alvo (str): Palavra a adivinhar (precisa estar na lista).
+            maximo_tentativas (int): Limite de tentativas (padrão: sem limite).
+        
+        Returns:
+            list: Palavras tentadas, em ordem; a última é a alvo se o resolvedor acertou.
+        """
+        indice_alvo = self.indices[palavra_alvo]
+        candidatos = np.arange(len(self.palavras))
+        tentativas = []
+        while maximo_tentativas is None or len(tentativas) < maximo_tentativas:
+            # A primeira tentativa é sempre a mesma, então é calculada uma única vez
+            if not tentativas:
+                if self.primeira_tentativa is None:
+                    self.primeira_tentativa = self.melhor_tentativa(candidatos)
+                tentativa = self.primeira_tentativa
+            else:
+                tentativa = self.melhor_tentativa(candidatos)
+
+            tentativas.append(self.palavras[tentativa])
+            if tentativa == indice_alvo:
+                break
+            padrao = self.matriz[tentativa, indice_alvo]
+            candidatos = candidatos[self.matriz[tentativa, candidatos] == padrao]
+        return tentativas
+
+# Resolvedores de cada processo da simulação, indexados pelo tamanho das palavras
+_resolvedores_processo = {}
+
+def _inicializar_simulacao(palavras_por_tamanho, primeiras_tentativas, diretorio_cache):
+    """
+    Prepara, em cada processo, os resolvedores com as matrizes já gravadas em disco
+    e as primeiras tentativas já calculadas pelo processo principal.
+    """
+    for tamanho, lista_palavras in palavras_por_tamanho.items():
+        matriz = carregar_matriz_padroes(lista_palavras, diretorio_cache)
+        _resolvedores_processo[tamanho] = ResolvedorTermo(lista_palavras, matriz, primeiras_tentativas[tamanho])
+
+def _simular_palavra(palavra):
+    """
+    Joga uma partida sem limite de tentativas e devolve (palavra, tentativas usadas).
+    """
+    return palavra, len(_resolvedores_processo[len(palavra)].resolver(palavra))
+
+def simular_lista(lista_palavras, processos=None, diretorio_cache="."):
+    """
+    Joga uma partida para cada palavra da lista, distribuindo os jogos entre processos.
+
+    As matrizes de padrões são calculadas (ou carregadas do cache) antes de iniciar os
+    processos, que as abrem diretamente do disco. A primeira tentativa de cada tamanho,
+    que avalia a lista inteira, também é calculada uma única vez e enviada aos processos.
+    
+    Args:
+        lista_palavras (list): Palavras a simular (por exemplo, de carregar_palavras).
+        processos (int): Quantidade de processos (padrão: número de núcleos).
+        diretorio_cache (str): Pasta onde as matrizes são guardadas.
+    
+    Returns:
+        dict: Tentativas necessárias para cada palavra.
+    """
+    palavras_por_tamanho = agrupar_por_tamanho(lista_palavras)
+    primeiras_tentativas = {}
+    for tamanho, lista_tamanho in palavras_por_tamanho.items():
+        resolvedor = ResolvedorTermo(lista_tamanho, carregar_matriz_padroes(lista_tamanho, diretorio_cache))
+        primeiras_tentativas[tamanho] = resolvedor.melhor_tentativa(np.arange(len(lista_tamanho)))
+
+    palavras = [palavra for lista_tamanho in palavras_por_tamanho.values() for palavra in lista_tamanho]
+    processos = processos or os.cpu_count() or 1
+    with ProcessPoolExecutor(processos, initializer=_inicializar_simulacao,
+                             initargs=(palavras_por_tamanho, primeiras_tentativas, diretorio_cache)) as executor:
+        tamanho_lote = max(1, len(palavras) // (processos * 8))
+        return dict(executor.map(_simular_palavra, palavras, chunksize=tamanho_lote))
+
+def mostrar_resumo_simulacao(resultados):
+    """
+    Exibe a distribuição de tentativas e as palavras mais difíceis da simulação.
+    
+    Args:
+        resultados (dict): Tentativas necessárias para cada palavra (de simular_lista).
+    """
+    if not resultados:
+        print("Nenhuma palavra foi simulada.")
+        return
+    distribuicao = {}
+    for tentativas in resultados.values():
+        distribuicao[tentativas] = distribuicao.get(tentativas, 0) + 1
+
+    media = sum(resultados.values()) / len(resultados)
+    derrotas = sum(quantidade for tentativas, quantidade in distribuicao.items() if tentativas > MAXIMO_TENTATIVAS)
+    print(f"Palavras simuladas: {len(resultados)}")
+    print(f"Média de tentativas: {media:.3f}")
+    print(f"Derrotas (mais de {MAXIMO_TENTATIVAS} tentativas): {derrotas}")
+    for tentativas in sorted(distribuicao):
+        print(f"  {tentativas} tentativa(s): {distribuicao[tentativas]}")
+
+    mais_dificeis = sorted(resultados, key=lambda palavra: (-resultados[palavra], palavra))[:10]
+    print("Palavras mais difíceis: " + ", ".join(f"{palavra} ({resultados[palavra]})" for palavra in mais_dificeis))
+
+# ===================== Servidor de Jogos ======================
+
+# Segundos sem receber tentativas até uma sessão ser encerrada
+TEMPO_MAXIMO_OCIOSO = 600
+
+# Conexões aguardando aceitação (picos de muitos jogadores entrando ao mesmo tempo)
+FILA_CONEXOES = 4096
+
+class IndicePalavras:
+    """
+    Dicionário de palavras carregado uma única vez e compartilhado por todas as sessões.
+
+    As palavras ficam separadas por tamanho: uma tupla por tamanho para o sorteio e um
+    frozenset por tamanho para validar tentativas em O(1).
+    """
+
+    __slots__ = ("palavras", "por_tamanho", "conjuntos")
+
+    def __init__(self, palavras_por_tamanho):
+        self.por_tamanho = {tamanho: tuple(lista) for tamanho, lista in palavras_por_tamanho.items()}
+        self.conjuntos = {tamanho: frozenset(lista) for tamanho, lista in self.por_tamanho.items()}
+        self.palavras = tuple(palavra for lista in self.por_tamanho.values() for palavra in lista)
+
+    def sortear(self):
+        """
+        Sorteia uma palavra com a mesma chance para todas as palavras do dicionário.
+        """
+        return random.choice(self.palavras)
+
+    def contem(self, palavra):
+        """
+        Verifica se a palavra pertence ao dicionário.
+        """
+        conjunto = self.conjuntos.get(len(palavra))
+        return conjunto is not None and palavra in conjunto
+
+def carregar_indice_palavras(nome_arquivo, arquivo_cache=None):
+    """
+    Carrega o dicionário de palavras, usando um cache binário quando disponível.
+
+    O cache (formato marshal) guarda o índice por tamanho junto com a data de modificação
+    e o tamanho do arquivo de origem; se o arquivo mudar, o cache é refeito.
+    
+    Args:
+        nome_arquivo (str): Caminho para o arquivo contendo as palavras.
+        arquivo_cache (str): Caminho do cache binário (opcional).
+    
+    Returns:
+        IndicePalavras: Índice das palavras, ou None se não houver palavras válidas.
+    """
+    try:
+        informacoes = os.stat(nome_arquivo)
+    except FileNotFoundError:
+        print(f"Erro: O arquivo '{nome_arquivo}' não foi encontrado.")
+        return None
+    assinatura = [informacoes.st_mtime_ns, informacoes.st_size]
+
+    if arquivo_cache and os.path.exists(arquivo_cache):
+        try:
+            with open(arquivo_cache, 'rb') as arquivo:
+                conteudo = marshal.load(arquivo)
+            if conteudo.get("origem") == assinatura:
+                return IndicePalavras(conteudo["palavras"])
+        except (OSError, EOFError, ValueError, TypeError, AttributeError):
+            pass  # Cache ilegível, corrompido ou de outra versão: é refeito abaixo
+
+    palavras_por_tamanho = agrupar_por_tamanho(carregar_palavras(nome_arquivo))
+    if not palavras_por_tamanho:
+        return None
+    if arquivo_cache:
+        arquivo_temporario = f"{arquivo_cache}.{os.getpid()}.tmp"
+        try:
+            with open(arquivo_temporario, 'wb') as arquivo:
+                marshal.dump({"origem": assinatura, "palavras": palavras_por_tamanho}, arquivo)
+            os.replace(arquivo_temporario, arquivo_cache)
+        except OSError as erro:
+            # O cache é opcional: sem ele, o índice continua disponível na memória
+            print(f"Atenção: Não foi possível gravar o cache '{arquivo_cache}': {erro.strerror}.")
+            try:
+                os.remove(arquivo_temporario)
+            except OSError:
+                pass
+    return IndicePalavras(palavras_por_tamanho)
+
+class SessaoTermo:
+    """
+    Estado de um jogo no servidor: palavra sorteada, contagem das letras e tentativas restantes.
+    """
+
+    __slots__ = ("palavra", "contagem", "tentativas_restantes")
+
+    def __init__(self, palavra):
+        self.palavra = palavra
+        self.contagem = indexar_palavra(palavra)
+        self.tentativas_restantes = MAXIMO_TENTATIVAS
+
+    def jogar(self, tentativa, indice):
+        """
+        Processa uma tentativa e devolve a mensagem a enviar ao jogador.
+        
+        Args:
+            tentativa (str): Palavra digitada pelo jogador.
+            indice (IndicePalavras): Dicionário usado para validar a tentativa.
+        
+        Returns:
+            str: Mensagem de resposta.
+        """
+        if len(tentativa) != len(self.palavra):
+            return f"Erro: A palavra deve conter exatamente {len(self.palavra)} letras."
+        if not indice.contem(tentativa):
+            return f"Erro: A palavra '{tentativa}' não está no dicionário."
+
+        self.tentativas_restantes -= 1
+        if tentativa == self.palavra:
+            usadas = MAXIMO_TENTATIVAS - self.tentativas_restantes
+            self.tentativas_restantes = 0
+            return f"Parabéns! Você acertou a palavra '{self.palavra}' em {usadas} tentativa(s)!"
+
+        feedback = f"Feedback: {renderizar_feedback(tentativa, calcular_padrao(self.palavra, tentativa, self.contagem))}"
+        if self.tentativas_restantes == 0:
+            return f"{feedback}\nVocê perdeu! A palavra correta era: '{self.palavra}'."
+        return f"{feedback}\nTentativas restantes: {self.tentativas_restantes}"
+
+    @property
+    def encerrada(self):
+        return self.tentativas_restantes == 0
+
+async def atender_jogador(leitor, escritor, indice):
+    """
+    Conduz os jogos de uma conexão: cada linha recebida é uma tentativa.
+    Ao fim de um jogo, "/nova" inicia outro e "/sair" encerra a conexão.
+    """
+    async def enviar(texto):
+        escritor.write((texto + "\n").encode('utf-8'))
+        try:
+            await asyncio.wait_for(escritor.drain(), TEMPO_MAXIMO_OCIOSO)
+        except asyncio.TimeoutError:
+            # O cliente não lê as respostas: descarta o que falta enviar e encerra a sessão
+            escritor.transport.abort()
+            raise
+
+    try:
+        sessao = SessaoTermo(indice.sortear())
+        await enviar(f"A palavra sorteada tem {len(sessao.palavra)} letras. Tentativas: {MAXIMO_TENTATIVAS}.")
+        while True:
+            linha = await asyncio.wait_for(leitor.readline(), TEMPO_MAXIMO_OCIOSO)
+            if not linha:
+                break
+            comando = linha.decode('utf-8', errors='replace').strip().lower()
+            if comando == "/sair":
+                break
+            if comando == "/nova":
+                sessao = SessaoTermo(indice.sortear())
+                await enviar(f"A palavra sorteada tem {len(sessao.palavra)} letras. Tentativas: {MAXIMO_TENTATIVAS}.")
+                continue
+            if sessao.encerrada:
+                await enviar("Jogo encerrado. Digite /nova para jogar novamente ou /sair para sair.")
+                continue
+
+            await enviar(sessao.jogar(comando, indice))
+            if sessao.encerrada:
+                await enviar("Digite /nova para jogar novamente ou /sair para sair.")
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    except ValueError:
+        # Linha maior que o limite do leitor (64 KiB): a conexão é encerrada sem registrar erro
+        pass
+    finally:
+        escritor.close()
+
+def executar_servidor(nome_arquivo, host="0.0.0.0", porta=8023, arquivo_cache=None, usar_cache=True):
+    """
+    Inicia o servidor de jogos, que atende muitas sessões simultâneas em uma única thread.
+    
+    Args:
+        nome_arquivo (str): Caminho para o arquivo contendo as palavras.
+        host (str): Endereço em que o servidor escuta.
+        porta (int): Porta TCP do servidor.
+        arquivo_cache (str): Cache binário do dicionário (por padrão, o arquivo de
+            palavras com extensão .cache, na mesma pasta).
+        usar_cache (bool): Se False, o dicionário é sempre lido do arquivo de palavras.
+    """
+    if not usar_cache:
+        arquivo_cache = None
+    elif arquivo_cache is None:
+        arquivo_cache = os.path.splitext(nome_arquivo)[0] + ".cache"
+
+    indice = carregar_indice_palavras(nome_arquivo, arquivo_cache)
+    if indice is None:
+        print("Erro: Nenhuma palavra válida foi encontrada no arquivo.")
+        return
+
+    async def servir():
+        servidor = await asyncio.start_server(
+            lambda leitor, escritor: atender_jogador(leitor, escritor, indice), host, porta,
+            backlog=FILA_CONEXOES
+        )
+        print(f"Servidor do Termo com {len(indice.palavras)} palavras aguardando conexões em {host}:{porta}.")
+        async with servidor:
+            await servidor.serve_forever()
+
+    try:
+        asyncio.run(servir())
+    except KeyboardInterrupt:
+        print("\nServidor encerrado.")
 
 if __name__ == "__main__":
     main()
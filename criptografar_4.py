@@ -1,50 +1,180 @@
+import mmap
 import os
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def criptografar_xor(arquivo_origem, senha, arquivo_destino):
+try:
+    import numpy as np
+except ImportError:  # Sem NumPy, o XOR é feito com inteiros grandes (int.from_bytes)
+    np = None
+
+# Quantidade de bytes lidos e criptografados por vez
+TAMANHO_BLOCO = 1024 * 1024
+
+def estender_chave(chave, tamanho_bloco):
     """
-    Criptografa os bytes de um arquivo usando a operação XOR com base em uma senha.
+    Repete a chave até cobrir um bloco inteiro a partir de qualquer deslocamento.
+
+    A chave estendida tem tamanho_bloco + len(chave) bytes, de modo que o trecho
+    [deslocamento:deslocamento + tamanho_bloco] existe para todo deslocamento válido.
+    Ela é calculada uma única vez por arquivo.
+
+    Args:
+        chave (bytes): Bytes da palavra-passe.
+        tamanho_bloco (int): Tamanho máximo dos blocos que serão criptografados.
+
+    Returns:
+        bytes: Chave repetida.
+    """
+    tamanho_total = tamanho_bloco + len(chave)
+    return (chave * (tamanho_total // len(chave) + 1))[:tamanho_total]
+
+def _xor_numpy(bloco, chave_estendida, deslocamento, saida):
+    """
+    Núcleo XOR com NumPy: opera em palavras de 8 bytes e trata o final byte a byte.
+    """
+    tamanho = len(bloco)
+    dados = np.frombuffer(bloco, dtype=np.uint8, count=tamanho)
+    chave = np.frombuffer(chave_estendida, dtype=np.uint8, count=tamanho, offset=deslocamento)
+    resultado = np.frombuffer(saida, dtype=np.uint8, count=tamanho)
+
+    tamanho_alinhado = tamanho - tamanho % 8
+    np.bitwise_xor(dados[:tamanho_alinhado].view(np.uint64), chave[:tamanho_alinhado].view(np.uint64),
+                   out=resultado[:tamanho_alinhado].view(np.uint64))
+    np.bitwise_xor(dados[tamanho_alinhado:], chave[tamanho_alinhado:], out=resultado[tamanho_alinhado:])
+
+def _xor_inteiro(bloco, chave_estendida, deslocamento, saida):
+    """
+    Núcleo XOR sem NumPy: trata o bloco e a chave como dois inteiros grandes.
+    """
+    tamanho = len(bloco)
+    trecho_chave = memoryview(chave_estendida)[deslocamento:deslocamento + tamanho]
+    valor = int.from_bytes(bloco, 'little') ^ int.from_bytes(trecho_chave, 'little')
+    saida[:tamanho] = valor.to_bytes(tamanho, 'little')
+
+def _xor_referencia(conteudo, chave):
+    """
+    Implementação original, byte a byte, mantida como referência para o benchmark.
+    """
+    dados_criptografados = bytearray()
+    tamanho_senha = len(chave)
+    for i, byte in enumerate(conteudo):
+        dados_criptografados.append(byte ^ chave[i % tamanho_senha])
+    return dados_criptografados
+
+# Núcleo XOR usado na criptografia: NumPy quando disponível, inteiros grandes caso contrário
+aplicar_xor_no_buffer = _xor_numpy if np is not None else _xor_inteiro
+
+def criptografar_fluxo(origem, destino, chave, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Criptografa um fluxo de bytes em blocos de tamanho fixo, com uso de memória constante.
+
+    A posição na chave é mantida entre os blocos, de modo que o resultado é idêntico
+    ao de criptografar o conteúdo inteiro de uma só vez. Os buffers de leitura e de
+    escrita e a chave estendida são alocados uma única vez e reutilizados.
+
+    Args:
+        origem (BinaryIO): Arquivo (ou fluxo) aberto para leitura binária.
+        destino (BinaryIO): Arquivo (ou fluxo) aberto para escrita binária.
+        chave (bytes): Bytes da palavra-passe.
+        tamanho_bloco (int): Quantidade de bytes lidos por vez.
+
+    Returns:
+        int: Quantidade de bytes processados.
+    """
+    chave_estendida = estender_chave(chave, tamanho_bloco)
+    entrada = bytearray(tamanho_bloco)
+    saida = bytearray(tamanho_bloco)
+    visao_entrada = memoryview(entrada)
+    visao_saida = memoryview(saida)
+
+    total_processado = 0
+    while True:
+        lidos = origem.readinto(entrada)
+        if not lidos:
+            return total_processado
+        aplicar_xor_no_buffer(visao_entrada[:lidos], chave_estendida, total_processado % len(chave), saida)
+        destino.write(visao_saida[:lidos])
+        total_processado += lidos
+
+def converter_senha(senha):
+    """
+    Valida a palavra-passe e a converte nos bytes da chave.
+
+    Args:
+        senha (str): Palavra-passe para a operação XOR.
+
+    Returns:
+        bytes: Chave da operação XOR, ou None se a senha for inválida.
+    """
+    # Verifica se a senha está preenchida
+    if not senha:
+        print("Erro: A palavra-passe não pode ser vazia.")
+        return None
+
+    # Cada caractere da senha corresponde a um byte da chave (código de 0 a 255)
+    try:
+        return senha.encode('latin-1')
+    except UnicodeEncodeError:
+        print("Erro: A palavra-passe deve conter apenas caracteres com código até 255.")
+        return None
+
+def validar_parametros(arquivo_origem, senha, arquivo_destino):
+    """
+    Valida os parâmetros da criptografia e converte a senha em bytes.
 
     Args:
         arquivo_origem (str): Caminho do arquivo de origem.
         senha (str): Palavra-passe para a operação XOR.
-        arquivo_destino (str): Caminho do arquivo de destino.
+        arquivo_destino (str): Caminho do arquivo de destino (None na criptografia no próprio arquivo).
 
     Returns:
-        None
+        bytes: Chave da operação XOR, ou None se algum parâmetro for inválido.
     """
     # Verifica se o arquivo de origem existe
     if not os.path.isfile(arquivo_origem):
         print(f"Erro: O arquivo de origem '{arquivo_origem}' não foi encontrado.")
-        return
+        return None
     
     # Verifica se o arquivo de destino já existe para evitar sobrescrita
-    if os.path.exists(arquivo_destino):
+    if arquivo_destino is not None and os.path.exists(arquivo_destino):
         print(f"Erro: O arquivo de destino '{arquivo_destino}' já existe. Escolha outro nome para evitar sobrescrita.")
-        return
+        return None
 
-    # Verifica se a senha está preenchida
-    if not senha:
-        print("Erro: A palavra-passe não pode ser vazia.")
+    return converter_senha(senha)
+
+def criptografar_xor(arquivo_origem, senha, arquivo_destino, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Criptografa os bytes de um arquivo usando a operação XOR com base em uma senha.
+
+    O arquivo é processado em blocos de tamanho fixo, então o uso de memória não
+    depende do tamanho do arquivo.
+
+    Args:
+        arquivo_origem (str): Caminho do arquivo de origem.
+        senha (str): Palavra-passe para a operação XOR.
+        arquivo_destino (str): Caminho do arquivo de destino.
+        tamanho_bloco (int): Quantidade de bytes lidos por vez.
+
+    Returns:
+        None
+    """
+    chave = validar_parametros(arquivo_origem, senha, arquivo_destino)
+    if chave is None:
         return
 
     try:
-        # Abre o arquivo de origem em modo binário para leitura
-        with open(arquivo_origem, 'rb') as origem:
-            conteudo_origem = origem.read()
-        
-        # Prepara um array de bytes para armazenar os dados criptografados
-        dados_criptografados = bytearray()
-        tamanho_senha = len(senha)
-        
-        # Aplica a criptografia XOR
-        for i, byte in enumerate(conteudo_origem):
-            byte_criptografado = byte ^ ord(senha[i % tamanho_senha])
-            dados_criptografados.append(byte_criptografado)
-        
-        # Grava os dados criptografados no arquivo de destino
-        with open(arquivo_destino, 'wb') as destino:
-            destino.write(dados_criptografados)
+        # Abre a origem para leitura e cria o destino (o modo 'x' falha se ele já existir)
+        with open(arquivo_origem, 'rb') as origem, open(arquivo_destino, 'xb') as destino:
+            try:
+                criptografar_fluxo(origem, destino, chave, tamanho_bloco)
+            except BaseException:
+                # Não deixa um arquivo de destino incompleto para trás
+                destino.close()
+                os.remove(arquivo_destino)
+                raise
 
         print(f"Criptografia concluída! O arquivo foi salvo como '{arquivo_destino}'.")
     
@@ -53,13 +183,311 @@ def criptografar_xor(arquivo_origem, senha, arquivo_destino):
     except Exception as erro_generico:
         print(f"Ocorreu um erro inesperado: {erro_generico}")
 
+def _criptografar_mapeamento(origem, destino, chave, trabalhadores):
+    """
+    Criptografa um arquivo mapeado em memória, dividindo-o em regiões processadas em paralelo.
+
+    Cada região tem um tamanho múltiplo do tamanho da chave, então todas começam na
+    posição 0 da chave e compartilham a mesma chave estendida. As regiões são acessadas
+    por memoryviews do mapeamento, sem cópias.
+
+    Args:
+        origem (mmap.mmap): Mapeamento do arquivo de origem.
+        destino (mmap.mmap): Mapeamento do arquivo de destino (pode ser o mesmo da origem).
+        chave (bytes): Bytes da palavra-passe.
+        trabalhadores (int): Quantidade de threads.
+    """
+    tamanho_regiao = max(1, TAMANHO_BLOCO // len(chave)) * len(chave)
+    chave_estendida = estender_chave(chave, tamanho_regiao)
+    visao_origem = memoryview(origem)
+    visao_destino = visao_origem if destino is origem else memoryview(destino)
+
+    def criptografar_regiao(inicio):
+        fim = min(inicio + tamanho_regiao, len(visao_origem))
+        aplicar_xor_no_buffer(visao_origem[inicio:fim], chave_estendida, 0, visao_destino[inicio:fim])
+
+    try:
+        with ThreadPoolExecutor(trabalhadores) as executor:
+            # list() propaga a primeira exceção ocorrida em uma das regiões
+            list(executor.map(criptografar_regiao, range(0, len(visao_origem), tamanho_regiao)))
+    finally:
+        # O mapeamento só pode ser fechado depois que as memoryviews forem liberadas
+        visao_destino.release()
+        visao_origem.release()
+
+def criptografar_xor_mmap(arquivo_origem, senha, arquivo_destino=None, no_lugar=False, trabalhadores=None):
+    """
+    Criptografa um arquivo mapeando-o em memória e processando regiões em paralelo.
+
+    Com o NumPy disponível, o XOR de cada região libera o GIL e as threads usam vários
+    núcleos. Com no_lugar=True, o próprio arquivo de origem é criptografado, sem gravar
+    uma segunda cópia em disco.
+
+    Args:
+        arquivo_origem (str): Caminho do arquivo de origem.
+        senha (str): Palavra-passe para a operação XOR.
+        arquivo_destino (str): Caminho do arquivo de destino (ignorado com no_lugar=True).
+        no_lugar (bool): Criptografa o arquivo de origem no próprio lugar.
+        trabalhadores (int): Quantidade de threads (padrão: número de núcleos).
+
+    Returns:
+        None
+    """
+    if not no_lugar and arquivo_destino is None:
+        print("Erro: Informe o arquivo de destino ou use a criptografia no próprio arquivo.")
+        return
+    chave = validar_parametros(arquivo_origem, senha, None if no_lugar else arquivo_destino)
+    if chave is None:
+        return
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+
+    try:
+        tamanho = os.path.getsize(arquivo_origem)
+        if no_lugar:
+            # Arquivos vazios não podem ser mapeados e não têm nada a criptografar
+            if tamanho:
+                with open(arquivo_origem, 'r+b') as arquivo, mmap.mmap(arquivo.fileno(), 0) as mapeamento:
+                    _criptografar_mapeamento(mapeamento, mapeamento, chave, trabalhadores)
+                    mapeamento.flush()
+            print(f"Criptografia concluída! O arquivo '{arquivo_origem}' foi criptografado no próprio lugar.")
+            return
+
+        with open(arquivo_origem, 'rb') as origem, open(arquivo_destino, 'x+b') as destino:
+            try:
+                if tamanho:
+                    destino.truncate(tamanho)
+                    with mmap.mmap(origem.fileno(), 0, access=mmap.ACCESS_READ) as mapa_origem, \
+                            mmap.mmap(destino.fileno(), 0) as mapa_destino:
+                        _criptografar_mapeamento(mapa_origem, mapa_destino, chave, trabalhadores)
+                        mapa_destino.flush()
+            except BaseException:
+                # Não deixa um arquivo de destino incompleto para trás
+                destino.close()
+                os.remove(arquivo_destino)
+                raise
+
+        print(f"Criptografia concluída! O arquivo foi salvo como '{arquivo_destino}'.")
+
+    except IOError as erro_io:
+        print(f"Erro de entrada/saída: {erro_io}")
+    except Exception as erro_generico:
+        print(f"Ocorreu um erro inesperado: {erro_generico}")
+
+def _modo_novos_arquivos():
+    """
+    Calcula as permissões que open() daria a um arquivo novo, aplicando a umask atual.
+
+    A umask só pode ser lida trocando-a, por isso a função deve ser chamada antes de
+    iniciar as threads de trabalho.
+
+    Returns:
+        int: Permissões para arquivos novos (por exemplo, 0o644 com umask 022).
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+def _criptografar_arquivo_atomico(arquivo_origem, arquivo_destino, chave, modo=None):
+    """
+    Criptografa um arquivo gravando primeiro em um arquivo temporário na mesma pasta.
+
+    O temporário só aparece com o nome final quando está completo. A troca de nome é
+    feita com os.link, que falha se o destino já existir, mantendo a garantia de não
+    sobrescrever arquivos mesmo que o destino seja criado por outro processo no meio.
+
+    Args:
+        arquivo_origem (str): Caminho do arquivo de origem.
+        arquivo_destino (str): Caminho do arquivo de destino.
+        chave (bytes): Bytes da palavra-passe.
+        modo (int): Permissões do arquivo de destino; por padrão, as de um arquivo
+            criado com open() sob a umask atual.
+
+    Returns:
+        int: Quantidade de bytes criptografados.
+    """
+    if modo is None:
+        modo = _modo_novos_arquivos()
+    pasta_destino = os.path.dirname(arquivo_destino) or "."
+    os.makedirs(pasta_destino, exist_ok=True)
+
+    # A origem é aberta antes do temporário, para que uma falha ao abri-la não deixe descritores abertos
+    with open(arquivo_origem, 'rb') as origem:
+        descritor, arquivo_temporario = tempfile.mkstemp(
+            dir=pasta_destino, prefix=f".{os.path.basename(arquivo_destino)}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descritor, 'wb') as destino:
+                # mkstemp cria o arquivo com permissão 0600, que o os.link manteria
+                os.fchmod(destino.fileno(), modo)
+                # Arquivos pequenos não precisam de buffers do tamanho de um bloco inteiro
+                tamanho_bloco = min(TAMANHO_BLOCO, max(os.fstat(origem.fileno()).st_size, 1))
+                total_processado = criptografar_fluxo(origem, destino, chave, tamanho_bloco)
+            os.link(arquivo_temporario, arquivo_destino)
+        finally:
+            os.remove(arquivo_temporario)
+    return total_processado
+
+def criptografar_diretorio(pasta_origem, senha, pasta_destino, trabalhadores=8):
+    """
+    Criptografa todos os arquivos de uma pasta (e subpastas) para outra pasta.
+
+    A estrutura de subpastas é reproduzida no destino. Os arquivos são processados por
+    um pool limitado de threads; arquivos de destino já existentes são mantidos e
+    contados como ignorados. Ao final, exibe um resumo com a vazão obtida.
+
+    Args:
+        pasta_origem (str): Pasta com os arquivos a criptografar.
+        senha (str): Palavra-passe para a operação XOR.
+        pasta_destino (str): Pasta onde os arquivos criptografados serão gravados.
+        trabalhadores (int): Quantidade máxima de arquivos processados ao mesmo tempo.
+
+    Returns:
+        dict: Resumo com arquivos criptografados, ignorados, com erro, bytes e tempo,
+        ou None se os parâmetros forem inválidos.
+    """
+    if not os.path.isdir(pasta_origem):
+        print(f"Erro: A pasta de origem '{pasta_origem}' não foi encontrada.")
+        return None
+    chave = converter_senha(senha)
+    if chave is None:
+        return None
+
+    # Monta a lista de trabalhos, sem descer na pasta de destino caso ela esteja dentro da origem
+    pasta_destino_real = os.path.realpath(pasta_destino)
+    trabalhos = []
+    ignorados = 0
+    for pasta_atual, subpastas, arquivos in os.walk(pasta_origem):
+        subpastas[:] = [
+            subpasta for subpasta in subpastas
+            if os.path.realpath(os.path.join(pasta_atual, subpasta)) != pasta_destino_real
+        ]
+        for nome_arquivo in arquivos:
+            arquivo_origem = os.path.join(pasta_atual, nome_arquivo)
+            arquivo_destino = os.path.join(pasta_destino, os.path.relpath(arquivo_origem, pasta_origem))
+            if os.path.exists(arquivo_destino):
+                ignorados += 1
+            else:
+                trabalhos.append((arquivo_origem, arquivo_destino))
+
+    modo = _modo_novos_arquivos()
+    criptografados = total_bytes = 0
+    erros = []
+    inicio = time.perf_counter()
+    ultimo_relatorio = inicio
+    with ThreadPoolExecutor(trabalhadores) as executor:
+        futuros = {
+            executor.submit(_criptografar_arquivo_atomico, arquivo_origem, arquivo_destino, chave, modo): arquivo_destino
+            for arquivo_origem, arquivo_destino in trabalhos
+        }
+        for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+            try:
+                total_bytes += futuro.result()
+                criptografados += 1
+            except FileExistsError:
+                ignorados += 1
+            except OSError as erro_io:
+                erros.append(f"{futuros[futuro]}: {erro_io}")
+
+            # Exibe o progresso no máximo uma vez por segundo
+            agora = time.perf_counter()
+            if agora - ultimo_relatorio >= 1 or concluidos == len(trabalhos):
+                print(f"Progresso: {concluidos}/{len(trabalhos)} arquivo(s)", end="\r", flush=True)
+                ultimo_relatorio = agora
+
+    tempo_total = time.perf_counter() - inicio
+    if trabalhos:
+        print()
+    for erro in erros:
+        print(f"Erro: {erro}")
+    print(f"Criptografados: {criptografados} arquivo(s), {total_bytes / 2 ** 20:.1f} MB em {tempo_total:.2f} s "
+          f"({criptografados / tempo_total if tempo_total else 0:.0f} arquivos/s, "
+          f"{total_bytes / 2 ** 20 / tempo_total if tempo_total else 0:.1f} MB/s). "
+          f"Ignorados (destino existente): {ignorados}. Com erro: {len(erros)}.")
+    return {
+        "criptografados": criptografados,
+        "ignorados": ignorados,
+        "erros": len(erros),
+        "bytes": total_bytes,
+        "tempo": tempo_total,
+    }
+
+def medir_desempenho(tamanho_mb=64, senha="senha-de-teste"):
+    """
+    Compara a velocidade dos núcleos XOR e confirma que todos geram a mesma saída.
+
+    A implementação original (byte a byte) é medida em uma amostra menor, por ser lenta;
+    os demais núcleos processam o volume completo em blocos de TAMANHO_BLOCO.
+
+    Args:
+        tamanho_mb (int): Volume de dados, em MB, processado pelos núcleos rápidos.
+        senha (str): Palavra-passe usada no teste.
+
+    Returns:
+        dict: Velocidade (MB/s) de cada implementação.
+    """
+    chave = senha.encode('latin-1')
+    dados = os.urandom(tamanho_mb * 1024 * 1024)
+    amostra = dados[:4 * 1024 * 1024]
+
+    inicio = time.perf_counter()
+    esperado = _xor_referencia(amostra, chave)
+    velocidades = {"referencia": len(amostra) / (time.perf_counter() - inicio) / 2 ** 20}
+
+    nucleos = {"inteiro": _xor_inteiro}
+    if np is not None:
+        nucleos["numpy"] = _xor_numpy
+
+    chave_estendida = estender_chave(chave, TAMANHO_BLOCO)
+    saida = bytearray(TAMANHO_BLOCO)
+    visao_dados = memoryview(dados)
+    for nome, nucleo in nucleos.items():
+        # Confere a saída na amostra (com blocos cujo tamanho não é múltiplo da chave)
+        resultado = bytearray()
+        for posicao in range(0, len(amostra), 1000):
+            trecho = visao_dados[posicao:min(posicao + 1000, len(amostra))]
+            nucleo(trecho, chave_estendida, posicao % len(chave), saida)
+            resultado += saida[:len(trecho)]
+        if resultado != esperado:
+            raise AssertionError(f"O núcleo '{nome}' gerou uma saída diferente da implementação original.")
+
+        inicio = time.perf_counter()
+        for posicao in range(0, len(dados), TAMANHO_BLOCO):
+            trecho = visao_dados[posicao:posicao + TAMANHO_BLOCO]
+            nucleo(trecho, chave_estendida, posicao % len(chave), saida)
+        velocidades[nome] = len(dados) / (time.perf_counter() - inicio) / 2 ** 20
+    return velocidades
+
 def main():
     """
     Função principal para coordenar a entrada e execução do programa.
     """
+    # Modo de benchmark: compara os núcleos XOR
+    if sys.argv[1:] == ["--benchmark"]:
+        for nome, velocidade in medir_desempenho().items():
+            print(f"{nome:<12} {velocidade:>10.1f} MB/s")
+        print("Saídas idênticas à implementação original.")
+        return
+
+    # Modo em lote: criptografa uma pasta inteira
+    if len(sys.argv) == 5 and sys.argv[1] == "--diretorio":
+        criptografar_diretorio(sys.argv[2], sys.argv[3], sys.argv[4])
+        return
+
+    # Modos com arquivo mapeado em memória
+    if len(sys.argv) == 5 and sys.argv[1] == "--mmap":
+        criptografar_xor_mmap(sys.argv[2], sys.argv[3], sys.argv[4])
+        return
+    if len(sys.argv) == 4 and sys.argv[1] == "--no-lugar":
+        criptografar_xor_mmap(sys.argv[2], sys.argv[3], no_lugar=True)
+        return
+
     # Confirma se os argumentos foram fornecidos corretamente
-    if len(sys.argv) != 4:
+    if len(sys.argv) != 4 or sys.argv[1].startswith("--"):
         print("Uso correto: python programa.py <arquivo_origem> <palavra_passe> <arquivo_destino>")
+        print("             python programa.py --mmap <arquivo_origem> <palavra_passe> <arquivo_destino>")
+        print("             python programa.py --no-lugar <arquivo> <palavra_passe>")
+        print("             python programa.py --diretorio <pasta_origem> <palavra_passe> <pasta_destino>")
+        print("             python programa.py --benchmark")
         return
 
     # Obtém os argumentos da linha de comando